@@ -0,0 +1,54 @@
+"""Memory used by a large population of instances with a cached float property
+
+Compares the default storage, in the instance `__dict__`, with `ColumnarStorage`,
+and with no property cached, for the memory of the instances themselves.
+
+    python -m benchmarks.columnar_memory
+"""
+import tracemalloc
+from functools import partial
+
+from more_properties import ColumnarStorage, cached_property
+
+POPULATION = 100_000
+
+
+def make_class(storage):
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        @partial(cached_property, storage=storage())
+        def norm(self):
+            return (self.x ** 2 + self.y ** 2) ** 0.5
+
+    return Point
+
+
+def measure(cls, read):
+    tracemalloc.start()
+
+    instances = [cls(i, i) for i in range(POPULATION)]
+
+    if read:
+        for instance in instances:
+            instance.norm
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size / POPULATION
+
+
+def main():
+    for name, storage, read in [
+        ("uncached", lambda: None, False),
+        ("__dict__", lambda: None, True),
+        ("ColumnarStorage", partial(ColumnarStorage, "d"), True),
+    ]:
+        print(f"{name:>16}: {measure(make_class(storage), read):6.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Memory used by a large population of instances with cached properties
+
+Compares the default storage, in the instance `__dict__`, with `SharedKeyStorage`,
+reading properties in a different order per instance, and clearing some caches.
+
+    python -m benchmarks.shared_key_memory
+"""
+import random
+import tracemalloc
+from functools import partial
+
+from more_properties import SharedKeyStorage, cached_property
+
+POPULATION = 100_000
+
+
+def make_class(storage):
+    def prop(name):
+        def getter(self):
+            return self.a + len(name)
+
+        return partial(cached_property, storage=storage())(getter)
+
+    class Record:
+        def __init__(self):
+            self.a, self.b, self.c, self.d, self.e, self.f = range(6)
+
+        p = prop("p")
+        q = prop("q")
+        r = prop("r")
+        s = prop("s")
+
+        p_clear_cache = p.clear_cache
+
+    return Record
+
+
+def measure(cls):
+    rng = random.Random(0)
+    names = ["p", "q", "r", "s"]
+
+    tracemalloc.start()
+
+    instances = [cls() for _ in range(POPULATION)]
+
+    for instance in instances:
+        for name in rng.sample(names, rng.randint(1, len(names))):
+            getattr(instance, name)
+
+        if rng.random() < 0.25:
+            instance.p_clear_cache()
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size / POPULATION
+
+
+def main():
+    for name, storage in [
+        ("__dict__", lambda: None),
+        ("SharedKeyStorage", SharedKeyStorage),
+    ]:
+        print(f"{name:>16}: {measure(make_class(storage)):6.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,45 @@
+import sys
+from typing import Any
+
+from more_properties.advisor import CachingAdvisor
+from more_properties.cache_manager import (
+    CacheManager,
+    get_cache_manager,
+    set_cache_manager,
+)
+from more_properties.cached_method import cached_class_method, cached_method
 from more_properties.cached_property import (
     cached_class_property,
+    cached_properties,
     cached_property,
     cached_static_property,
 )
 from more_properties.class_property import class_property, static_property
+from more_properties.epochs import bump_epoch
+from more_properties.freeze import freeze, freeze_all, unfreeze, unfreeze_all
+from more_properties.incremental_property import incremental_cached_property
+from more_properties.interning import InternTable
+from more_properties.local_property import (
+    context_cached_class_property,
+    context_cached_property,
+    context_cached_static_property,
+    thread_local_cached_class_property,
+    thread_local_cached_property,
+    thread_local_cached_static_property,
+)
+from more_properties.module_property import cached_module_property, module_property
+from more_properties.pickling import exclude_caches
 from more_properties.property import property
+from more_properties.storage import (
+    CacheStorage,
+    ColumnarStorage,
+    ExternalStorage,
+    SharedKeyStorage,
+)
+from more_properties.versioned_property import (
+    VersionedType,
+    versioned_cached_class_property,
+)
 
 __all__ = [
     "property",
@@ -15,10 +50,55 @@ __all__ = [
     "cached_property",
     "cached_class_property",
     "cached_static_property",
+    "cached_properties",
+    "batched_cached_property",
+    "incremental_cached_property",
+    "versioned_cached_class_property",
+    "VersionedType",
+    "thread_local_cached_property",
+    "thread_local_cached_class_property",
+    "thread_local_cached_static_property",
+    "context_cached_property",
+    "context_cached_class_property",
+    "context_cached_static_property",
+    "cached_method",
+    "cached_class_method",
+    "module_property",
+    "cached_module_property",
+    "freeze",
+    "freeze_all",
+    "unfreeze",
+    "unfreeze_all",
+    "exclude_caches",
+    "InternTable",
+    "CacheStorage",
+    "ColumnarStorage",
+    "SharedKeyStorage",
+    "ExternalStorage",
+    "CacheManager",
+    "get_cache_manager",
+    "set_cache_manager",
+    "bump_epoch",
+    "CachingAdvisor",
 ]
 
 __version__ = "1.1.1"
 
+if sys.version_info < (3, 7):
+    from more_properties.batching import batched_cached_property
+else:
+
+    def __getattr__(name: str) -> Any:
+        # Imported on first use, as importing asyncio is slow (PEP 562)
+        if name == "batched_cached_property":
+            from more_properties.batching import batched_cached_property
+
+            globals()[name] = batched_cached_property
+
+            return batched_cached_property
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Providing aliases for consistency with classmethod and staticmethod
 classproperty = class_property
 staticproperty = static_property
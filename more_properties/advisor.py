@@ -0,0 +1,242 @@
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from more_properties.class_property import ClassProperty, StaticProperty
+from more_properties.lru import LRUCache
+from more_properties.property import Property
+
+__all__ = [
+    "CachingAdvisor",
+]
+
+Get = Callable[[Property[Any, Any], Any, type], Any]
+
+_missing = object()
+
+_active: "Optional[CachingAdvisor]" = None
+
+
+@dataclass
+class PropertyStats:
+    kind: str
+    calls: int = 0
+    sampled: int = 0
+    time: float = 0.0
+    receivers: int = 0
+    compared: int = 0
+    repeats: int = 0
+    previous: "LRUCache[int, Any]" = field(
+        default_factory=LRUCache, repr=False, compare=False
+    )
+
+
+@dataclass
+class Candidate:
+    """A property whose values repeated for each receiver, so could be cached"""
+
+    owner: type
+    name: str
+    suggestion: str
+    calls: int
+    receivers: int
+    mean_time: float
+    estimated_savings: float
+    freezable: bool
+
+
+@dataclass
+class CachingAdvisor:
+    """Profiles uncached properties, to recommend those to cache
+
+    While active, every `sample_every` access of each `property`, `class_property`,
+    or `static_property` is timed, and its value compared to the previous value for
+    the same receiver, remembered for the `max_receivers` most recent receivers.
+    Receivers are told apart by identity, so are approximate once garbage collected.
+    """
+
+    sample_every: int = 1
+    max_receivers: int = 1024
+    stats: Dict[Tuple[type, str], PropertyStats] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    names: Dict[int, Tuple[Property[Any, Any], str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __enter__(self) -> "CachingAdvisor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        global _active
+
+        if _active is not None:
+            raise RuntimeError("Another caching advisor is already active")
+
+        _active = self
+        setattr(Property, "__get__", _profiled_get)
+
+    def stop(self) -> None:
+        global _active
+
+        if _active is self:
+            _active = None
+            setattr(Property, "__get__", _original_get)
+
+    def record(
+        self, prop: Property[Any, Any], instance: Any, owner: type, get: Get
+    ) -> Any:
+        key = (owner, self.attribute_name(prop, owner))
+
+        with self.lock:
+            stats = self.stats.get(key)
+
+            if stats is None:
+                stats = self.stats[key] = PropertyStats(
+                    _kind(prop), previous=LRUCache(self.max_receivers)
+                )
+
+            stats.calls += 1
+            sampled = stats.calls % self.sample_every == 0
+
+        if not sampled:
+            return get(prop, instance, owner)
+
+        start = perf_counter()
+        value = get(prop, instance, owner)
+        elapsed = perf_counter() - start
+
+        receiver = _receiver(prop, instance, owner)
+
+        with self.lock:
+            stats.sampled += 1
+            stats.time += elapsed
+
+            previous = stats.previous.get(id(receiver), _missing)
+
+            if previous is _missing:
+                stats.receivers += 1
+            else:
+                stats.compared += 1
+                stats.repeats += _equal(previous, value)
+
+            stats.previous[id(receiver)] = value
+
+        return value
+
+    def attribute_name(self, prop: Property[Any, Any], owner: type) -> str:
+        # Keyed by identity, holding the property so the identity isn't reused
+        entry = self.names.get(id(prop))
+
+        if entry is not None and entry[0] is prop:
+            return entry[1]
+
+        name = _attribute_name(prop, owner)
+        self.names[id(prop)] = (prop, name)
+
+        return name
+
+    def report(self) -> List[Candidate]:
+        """Properties whose values always repeated, by estimated time saved if cached
+
+        Savings are estimated as the time taken by the calls that repeated a value.
+        """
+        candidates = []
+
+        with self.lock:
+            for (owner, name), stats in self.stats.items():
+                if not stats.compared or stats.repeats != stats.compared:
+                    continue
+
+                mean_time = stats.time / stats.sampled
+
+                candidates.append(
+                    Candidate(
+                        owner=owner,
+                        name=name,
+                        suggestion=f"cached_{stats.kind}",
+                        calls=stats.calls,
+                        receivers=stats.receivers,
+                        mean_time=mean_time,
+                        estimated_savings=(
+                            mean_time * stats.calls * stats.repeats / stats.sampled
+                        ),
+                        freezable=stats.kind != "property",
+                    )
+                )
+
+        candidates.sort(key=lambda candidate: candidate.estimated_savings, reverse=True)
+
+        return candidates
+
+    def clear(self) -> None:
+        with self.lock:
+            self.stats.clear()
+            self.names.clear()
+
+
+def _kind(prop: Property[Any, Any]) -> str:
+    if isinstance(prop, StaticProperty):
+        return "static_property"
+
+    if isinstance(prop, ClassProperty):
+        return "class_property"
+
+    return "property"
+
+
+def _receiver(prop: Property[Any, Any], instance: Any, owner: type) -> Any:
+    if isinstance(prop, StaticProperty):
+        return None
+
+    if isinstance(prop, ClassProperty):
+        return owner
+
+    return instance
+
+
+def _attribute_name(prop: Property[Any, Any], owner: type) -> str:
+    # Properties may share a getter, or be defined from one named differently
+    for base in owner.__mro__:
+        for name, attr in base.__dict__.items():
+            if attr is prop:
+                return name
+
+    return _getter_name(prop)
+
+
+def _getter_name(prop: Property[Any, Any]) -> str:
+    fget = prop.__dict__["fget"]
+    func = getattr(fget, "__func__", getattr(fget, "getable", fget))
+
+    return getattr(func, "__name__", repr(prop))
+
+
+def _equal(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+
+    try:
+        return bool(a == b)
+    except Exception:
+        # Such as arrays, compared elementwise
+        return False
+
+
+_original_get: Get = Property.__get__  # type: ignore
+
+
+def _profiled_get(prop: Property[Any, Any], instance: Any, owner: Type[Any]) -> Any:
+    advisor = _active
+
+    # Cached properties call the original, through super(), when computing values
+    if advisor is None or type(prop).__get__ is not _profiled_get:
+        return _original_get(prop, instance, owner)
+
+    return advisor.record(prop, instance, owner, _original_get)
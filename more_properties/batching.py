@@ -0,0 +1,171 @@
+import asyncio
+import sys
+from asyncio import AbstractEventLoop, Future
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from more_properties.cached_property import CachedProperty
+
+__all__ = [
+    "batched_cached_property",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+VT = TypeVar("VT")  # Value Type
+
+# get_event_loop is deprecated when no loop is running, but is all Python 3.6 has
+if sys.version_info < (3, 7):
+    get_running_loop = asyncio.get_event_loop
+else:
+    get_running_loop = asyncio.get_running_loop
+
+BatchLoader = Callable[[List[Hashable]], Awaitable[Sequence[Any]]]
+
+
+@dataclass
+class Batch:
+    loop: AbstractEventLoop
+    # Futures of the receivers of each key
+    receivers: "Dict[Hashable, List[Tuple[Any, Future[Any]]]]" = field(
+        default_factory=dict
+    )
+
+
+@dataclass
+class BatchedCachedProperty(CachedProperty[OT, VT]):
+    """Loads values together, with those of all instances accessed in the same tick
+
+    The getter returns the key of the value to load, for `load_batch`.
+    Accessing the property gives an awaitable value.
+    """
+
+    load_batch: Optional[BatchLoader] = None
+    max_batch_size: Optional[int] = None
+
+    # Cached futures are cleared on failure, rather than evicted
+    managed: bool = False
+
+    pending_batch: Optional[Batch] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.load_batch is None:
+            raise ValueError("Batched cached properties need a load_batch function")
+
+        if self.eager or self.write_through or self.storage is not None:
+            raise ValueError(
+                "Batched cached properties can't be eager, write through, or stored"
+            )
+
+        super().__post_init__()
+
+    def __get__(  # type: ignore
+        self, instance: Optional[OT], owner: Type[OT]
+    ) -> "Future[VT]":
+        cache = instance.__dict__
+        future: "Optional[Future[VT]]" = cache.get(self.cache_name)
+
+        # Cancelled if the batch was, so loaded again
+        if future is None or future.cancelled():
+            future = cache[self.cache_name] = self.load(instance, owner)
+
+        # Shielded, so cancelling one access doesn't cancel the others
+        return asyncio.shield(future)
+
+    def load(self, instance: Optional[OT], owner: Type[OT]) -> "Future[VT]":
+        self.stats.misses += 1
+
+        key = super(CachedProperty, self).__get__(instance, owner)
+        batch = self.batch(get_running_loop())
+        future: "Future[VT]" = batch.loop.create_future()
+
+        # Identical keys are loaded once per batch
+        batch.receivers.setdefault(key, []).append((instance, future))
+
+        # Full batches are still dispatched, but later loads go in a new batch
+        max_batch_size = self.max_batch_size
+
+        if max_batch_size is not None and len(batch.receivers) >= max_batch_size:
+            self.pending_batch = None
+
+        return future
+
+    def transient_names(self) -> List[str]:
+        # Futures can't be transferred
+        return [self.cache_name]
+
+    def batch(self, loop: AbstractEventLoop) -> Batch:
+        """The batch to add loads to, dispatched at the end of the current tick"""
+        batch = self.pending_batch
+
+        if batch is None or batch.loop is not loop:
+            batch = self.pending_batch = Batch(loop)
+            loop.call_soon(self.dispatch, batch)
+
+        return batch
+
+    def dispatch(self, batch: Batch) -> None:
+        if self.pending_batch is batch:
+            self.pending_batch = None
+
+        batch.loop.create_task(self.run(batch))
+
+    async def run(self, batch: Batch) -> None:
+        keys = list(batch.receivers)
+        values: Optional[Sequence[Any]] = None
+        error: Optional[Exception] = None
+
+        try:
+            loaded = await self.load_batch(keys)  # type: ignore
+
+            if len(loaded) != len(keys):
+                raise ValueError(
+                    f"Batch loader returned {len(loaded)} values for {len(keys)} keys"
+                )
+
+            values = loaded
+        except Exception as e:
+            error = e
+        finally:
+            # Also run if cancelled, so no receiver is left waiting
+            for i, key in enumerate(keys):
+                for instance, future in batch.receivers[key]:
+                    self.resolve(instance, future, values, i, error)
+
+    def resolve(
+        self,
+        instance: Any,
+        future: "Future[Any]",
+        values: Optional[Sequence[Any]],
+        i: int,
+        error: Optional[Exception],
+    ) -> None:
+        if values is None and instance.__dict__.get(self.cache_name) is future:
+            # Failed loads are retried on next access
+            del instance.__dict__[self.cache_name]
+
+        if future.done():
+            return
+
+        if values is not None:
+            future.set_result(values[i])
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.cancel()
+
+
+batched_cached_property = BatchedCachedProperty
@@ -0,0 +1,166 @@
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from threading import RLock
+from typing import Any, Callable, Optional, Tuple
+from weakref import ref
+
+__all__ = [
+    "CacheManager",
+    "get_cache_manager",
+    "set_cache_manager",
+]
+
+EntryKey = Tuple[int, Optional[int]]
+
+
+@dataclass
+class Entry:
+    prop: "ref[Any]"
+    receiver: "Optional[ref[Any]]"
+    owner: "ref[type]"
+    size: int
+    cost: float
+    priority: float
+
+    @property
+    def score(self) -> float:
+        """How much keeping the entry is worth, per byte"""
+        return self.priority * (self.cost + 1e-9) / max(self.size, 1)
+
+    def clear(self) -> None:
+        prop, owner = self.prop(), self.owner()
+        receiver = self.receiver() if self.receiver is not None else None
+
+        if prop is None or owner is None:
+            return
+
+        if self.receiver is not None and receiver is None:
+            return
+
+        prop.clear_cache.__get__(receiver, owner)()
+
+
+@dataclass
+class CacheManager:
+    """Keeps the values of all managed cached properties within a budget
+
+    When over budget, values are evicted by clearing their caches.
+    The least recently used `sample_size` values are considered for eviction,
+    and the one with the lowest priority times compute time per byte is evicted.
+    Sizes are measured by `sizeof`, by default `sys.getsizeof`, which is shallow,
+    so doesn't count the objects a value refers to.
+    """
+
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    sizeof: Callable[[Any], int] = sys.getsizeof
+    sample_size: int = 8
+    entries: "OrderedDict[EntryKey, Entry]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    total_bytes: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    lock: RLock = field(default_factory=RLock, init=False, repr=False)
+
+    @staticmethod
+    def key(prop: Any, receiver: Any) -> EntryKey:
+        return id(prop), id(receiver) if receiver is not None else None
+
+    def track(
+        self,
+        prop: Any,
+        receiver: Any,
+        owner: type,
+        value: Any,
+        cost: float,
+        priority: float = 1,
+    ) -> None:
+        """Record that `prop` cached `value` for `receiver`, taking `cost` seconds"""
+        key = self.key(prop, receiver)
+
+        try:
+            receiver_ref = (
+                ref(receiver, lambda _: self.forget_key(key))
+                if receiver is not None
+                else None
+            )
+        except TypeError:
+            # Not weakly referenceable, so can't be told apart from a later receiver
+            return
+
+        entry = Entry(
+            ref(prop), receiver_ref, ref(owner), self.sizeof(value), cost, priority
+        )
+
+        with self.lock:
+            self.forget_key(key)
+
+            self.entries[key] = entry
+            self.total_bytes += entry.size
+
+            self.evict()
+
+    def touch(self, prop: Any, receiver: Any) -> None:
+        """Record that a cached value has been used"""
+        key = self.key(prop, receiver)
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+
+    def forget(self, prop: Any, receiver: Any) -> None:
+        """Record that a cached value has been cleared"""
+        self.forget_key(self.key(prop, receiver))
+
+    def forget_key(self, key: EntryKey) -> None:
+        with self.lock:
+            entry = self.entries.pop(key, None)
+
+            if entry is not None:
+                self.total_bytes -= entry.size
+
+    def over_budget(self) -> bool:
+        return (
+            self.max_entries is not None and len(self.entries) > self.max_entries
+        ) or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+
+    def evict(self) -> None:
+        with self.lock:
+            # The most recent entry is never evicted, as it's still being cached
+            while len(self.entries) > 1 and self.over_budget():
+                candidates = islice(
+                    self.entries.items(), min(self.sample_size, len(self.entries) - 1)
+                )
+                key, entry = min(candidates, key=lambda item: item[1].score)
+
+                self.forget_key(key)
+                self.evictions += 1
+
+                entry.clear()
+
+    def clear(self) -> None:
+        """Clear all managed caches"""
+        with self.lock:
+            entries = list(self.entries.values())
+
+            self.entries.clear()
+            self.total_bytes = 0
+
+        for entry in entries:
+            entry.clear()
+
+
+active: Optional[CacheManager] = None
+
+
+def get_cache_manager() -> Optional[CacheManager]:
+    return active
+
+
+def set_cache_manager(manager: Optional[CacheManager]) -> None:
+    """Manage all cached properties by `manager`, unless `managed=False`"""
+    global active
+
+    active = manager
@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from more_properties.lru import LRUCache
+from more_properties.types import Deleter, Uncached
+
+__all__ = [
+    "cached_method",
+    "cached_class_method",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+VT = TypeVar("VT")  # Value Type
+
+MethodCache = LRUCache[Hashable, Any]
+
+
+_uncached = Uncached()
+_kwargs_mark = Uncached()
+
+# Types whose instances are never equal to instances of other types of the same kind
+_fast_types = {int, str}
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    if kwargs:
+        return (*args, _kwargs_mark, *kwargs.items())
+
+    if len(args) == 1 and type(args[0]) in _fast_types:
+        return args[0]
+
+    return args
+
+
+@dataclass
+class CachedMethod(Generic[OT, VT]):
+    func: Callable[..., VT]
+    maxsize: Optional[int] = 128
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.__doc__ = getattr(self.func, "__doc__", None)
+
+    def __set_name__(self, owner: Type[OT], name: str) -> None:
+        self.name = name
+
+    @property
+    def cache_name(self) -> str:
+        if self.name is None:
+            raise AttributeError(f"Method {self!r} not assigned to class")
+
+        return f"__{self.name}_cache"
+
+    def __get__(self, instance: Optional[OT], owner: Type[OT]) -> Callable[..., VT]:
+        if instance is None:
+            return self  # type: ignore
+
+        return partial(self.call, instance)
+
+    def __call__(self, receiver: Any, *args: Any, **kwargs: Any) -> VT:
+        # As when accessed through the class, like plain methods
+        return self.call(receiver, *args, **kwargs)
+
+    def cache(self, instance: OT) -> MethodCache:
+        cache_name = self.cache_name
+
+        try:
+            cache: MethodCache = instance.__dict__[cache_name]
+        except KeyError:
+            cache = instance.__dict__[cache_name] = LRUCache(self.maxsize)
+
+        return cache
+
+    def call(self, receiver: Any, *args: Any, **kwargs: Any) -> VT:
+        cache = self.cache(receiver)
+        key = make_key(args, kwargs)
+
+        value: Any = cache.get(key, _uncached)
+
+        if value is _uncached:
+            value = cache[key] = self.func(receiver, *args, **kwargs)
+
+        return value
+
+    def transient_names(self) -> List[str]:
+        # Method caches are only meaningful to the process that made them
+        return [self.cache_name]
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        def clear_cache(instance: OT) -> None:
+            cache_name = self.cache_name
+
+            if cache_name in instance.__dict__:
+                delattr(instance, cache_name)
+
+        # Mypy doesn't recognize functions as Getable
+        return clear_cache  # type: ignore
+
+
+@dataclass
+class CachedClassMethod(CachedMethod[OT, VT]):
+    def __get__(self, instance: Optional[OT], owner: Type[OT]) -> Callable[..., VT]:
+        return partial(self.call, owner)
+
+    def cache(self, owner: Type[OT]) -> MethodCache:  # type: ignore
+        cache_name = self.cache_name
+
+        try:
+            cache: MethodCache = owner.__dict__[cache_name]
+        except KeyError:
+            cache = LRUCache(self.maxsize)
+            setattr(owner, cache_name, cache)
+
+        return cache
+
+    def transient_names(self) -> List[str]:
+        return []
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        def clear_cache(owner: Type[OT]) -> None:
+            cache_name = self.cache_name
+
+            if cache_name in owner.__dict__:
+                delattr(owner, cache_name)
+
+        return classmethod(clear_cache)
+
+
+cached_method = CachedMethod
+cached_class_method = CachedClassMethod
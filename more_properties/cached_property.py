@@ -1,29 +1,195 @@
-from dataclasses import dataclass
-from typing import Optional, Type, TypeVar, Union
-
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakSet, ref
+
+from more_properties import cache_manager
 from more_properties.class_property import ClassProperty, StaticProperty
-from more_properties.types import Deleter
+from more_properties.epochs import Epoch, get_epoch
+from more_properties.hooks import add_init_hook, add_subclass_hook, resolve
+from more_properties.interning import InternTable
+from more_properties.lru import LRUCache
+from more_properties.storage import CacheStorage, ColumnarStorage
+from more_properties.types import Deleter, Uncached
 from more_properties.util_properties import NamedProperty
 
 __all__ = [
     "cached_property",
     "cached_class_property",
     "cached_static_property",
+    "cached_properties",
 ]
 
 OT = TypeVar("OT", contravariant=True)  # Owner Type
 VT = TypeVar("VT")  # Value Type
 
 
-class Uncached:
+Cache = Union[VT, Uncached]
+
+_missing = object()
+
+
+class WeakValue(ref):
+    def __reduce__(self) -> Any:
+        # Referents aren't copied or pickled, so copies recompute the value
+        return _dead_weak_value, ()
+
+
+class _Collected:
     pass
 
 
-Cache = Union[VT, Uncached]
+# Created referring to a temporary object, so dead from the start
+_dead = WeakValue(_Collected())
+
+
+def _dead_weak_value() -> WeakValue:
+    return _dead
+
+
+class Stamped:
+    """A cached value, with the number of the epoch it was computed in"""
+
+    __slots__ = ("number", "value")
+
+    def __init__(self, number: int, value: Any) -> None:
+        self.number = number
+        self.value = value
+
+
+class Pending:
+    """A value being computed in the background, left out of copies and pickles"""
+
+    __slots__ = ("future",)
+
+    def __init__(self, future: "Optional[Future[Any]]" = None) -> None:
+        self.future = future
+
+    def __reduce__(self) -> Any:
+        # Copies compute their own values, as futures can't be copied or pickled
+        return Pending, ()
+
+
+@dataclass
+class CacheStats:
+    misses: int = 0
+    collected: int = 0
+
+
+@dataclass
+class KeepAlive:
+    """Strongly hold the most recently used values, emulating soft references"""
+
+    size: int
+    values: "OrderedDict[int, Any]" = field(default_factory=OrderedDict)
+    lock: Lock = field(default_factory=Lock)
+
+    def touch(self, value: Any) -> None:
+        with self.lock:
+            self.values[id(value)] = value
+            self.values.move_to_end(id(value))
+
+            while len(self.values) > self.size:
+                self.values.popitem(last=False)
+
+
+# Classes with class level cached properties
+class_cache_owners: "WeakSet[type]" = WeakSet()
+
+_default_executor: Optional[Executor] = None
+_default_executor_lock = Lock()
+
+
+def default_executor() -> Executor:
+    global _default_executor
+
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="more_properties")
+
+        return _default_executor
 
 
 @dataclass
 class CachedProperty(NamedProperty[OT, VT]):
+    eager: bool = False
+    executor: Optional[Executor] = None
+    weak: bool = False
+    keep_alive: int = 0
+    persist: bool = False
+    intern: Union[bool, InternTable] = False
+    write_through: bool = False
+    storage: Optional[CacheStorage] = None
+    managed: bool = True
+    priority: float = 1
+    key: Optional[Callable[[Any], Hashable]] = None
+    key_cache_size: Optional[int] = 1024
+    epoch: Optional[str] = None
+    stats: CacheStats = field(
+        default_factory=CacheStats, init=False, repr=False, compare=False
+    )
+    recent: Optional[KeepAlive] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    intern_table: Optional[InternTable] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    key_cache: "Optional[LRUCache[Hashable, VT]]" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    key_cache_stamp: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    current_epoch: Optional[Epoch] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.weak and self.keep_alive:
+            self.recent = KeepAlive(self.keep_alive)
+
+        if isinstance(self.intern, InternTable):
+            self.intern_table = self.intern
+        elif self.intern:
+            self.intern_table = InternTable()
+
+        if self.key is not None:
+            self.key_cache = LRUCache(self.key_cache_size)
+
+        # Pending values are kept in the instance `__dict__`, which stored ones avoid
+        if self.eager and self.storage is not None:
+            raise ValueError("Cached properties with storage can't be eager")
+
+        if self.epoch is not None:
+            if isinstance(self.storage, ColumnarStorage):
+                raise ValueError("Columnar storage can't hold the epochs of values")
+
+            self.current_epoch = get_epoch(self.epoch)
+
+        super().__post_init__()
+
+    def __set_name__(self, owner: Type[OT], name: str) -> None:
+        super().__set_name__(owner, name)
+
+        if self.storage is not None:
+            self.storage.bind(owner, name)
+
+        if self.eager:
+            add_init_hook(owner, self.precompute)
+
     @property
     def cache_name(self) -> str:
         if self.name is None:
@@ -31,13 +197,59 @@ class CachedProperty(NamedProperty[OT, VT]):
 
         return f"__{self.name}_cache"
 
+    @property
+    def pending_name(self) -> str:
+        if self.name is None:
+            raise AttributeError(f"Property {self!r} not assigned to class")
+
+        return f"__{self.name}_pending"
+
     def __get__(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        if self.storage is not None:
+            return self.get_stored(instance, owner, self.storage)
+
         cache_name = self.cache_name
+        cache = instance.__dict__
+
+        # Looked up once, as it may be evicted by another thread in between
+        value = cache.get(cache_name, _missing)
+
+        if value is not _missing:
+            if cache_manager.active is not None:
+                self.touch(instance, owner)
+
+            if type(value) is not WeakValue and type(value) is not Stamped:
+                return value
+
+            value = self.unwrap(value)
+
+            if not isinstance(value, Uncached):
+                return value
 
-        if cache_name not in instance.__dict__:
-            instance.__dict__[cache_name] = super().__get__(instance, owner)
+        stamp = self.stamp()
+        value = self.compute(instance, owner)
 
-        value: VT = instance.__dict__[cache_name]
+        cache[cache_name] = self.store(value, stamp)
+
+        return value
+
+    def get_stored(
+        self, instance: Optional[OT], owner: Type[OT], storage: CacheStorage
+    ) -> VT:
+        value = storage.load(instance)
+
+        if type(value) is WeakValue or type(value) is Stamped:
+            value = self.unwrap(value)
+
+        if isinstance(value, Uncached):
+            stamp = self.stamp()
+
+            # Such as in the type of its column, so misses match hits
+            value = storage.coerce(self.compute(instance, owner))
+
+            storage.save(instance, self.store(value, stamp))
+        elif cache_manager.active is not None:
+            self.touch(instance, owner)
 
         return value
 
@@ -47,7 +259,32 @@ class CachedProperty(NamedProperty[OT, VT]):
 
         clear_cache.__get__(instance, type(instance))()
 
-        super().__set__(instance, value)
+        if not self.write_through:
+            super().__set__(instance, value)
+            return
+
+        fset = self.__dict__["fset"]
+
+        if fset is None:
+            raise AttributeError("can't set attribute")
+
+        # Setters may return a transformed value to cache in place of the one given
+        result = fset.__get__(instance, type(instance))(value)
+
+        if result is not None:
+            value = result
+
+        if self.intern_table is not None:
+            value = self.intern_table.intern(value)
+
+        self.write(instance, type(instance), value)
+
+        manager = cache_manager.active if self.managed else None
+
+        if manager is not None:
+            # Written values cost nothing to recompute, so are the first to be evicted
+            receiver = self.receiver(instance, type(instance))
+            manager.track(self, receiver, type(instance), value, 0, self.priority)
 
     def __delete__(self, instance: OT) -> None:
         # Mypy seems to unwrap the descriptor recursively, while Python only does it once
@@ -57,13 +294,210 @@ class CachedProperty(NamedProperty[OT, VT]):
 
         super().__delete__(instance)
 
+    def stamp(self) -> Optional[int]:
+        """The number of the current epoch, taken before computing a value"""
+        return self.current_epoch.number if self.current_epoch is not None else None
+
+    def store(self, value: VT, stamp: Optional[int]) -> Any:
+        stored: Any = value
+
+        if self.weak:
+            try:
+                stored = WeakValue(value)
+            except TypeError:
+                # Not weakly referenceable, so held strongly
+                pass
+            else:
+                if self.recent is not None:
+                    self.recent.touch(value)
+
+        if stamp is not None:
+            stored = Stamped(stamp, stored)
+
+        return stored
+
+    def unwrap(self, stored: Any) -> Cache[VT]:
+        if type(stored) is Stamped:
+            if stored.number != self.current_epoch.number:  # type: ignore
+                return Uncached()
+
+            stored = stored.value
+
+        if type(stored) is WeakValue:
+            return self.dereference(stored)
+
+        value: VT = stored
+
+        return value
+
+    def dereference(self, stored: WeakValue) -> Cache[VT]:
+        value: Optional[VT] = stored()
+
+        if value is None:
+            self.stats.collected += 1
+
+            return Uncached()
+
+        if self.recent is not None:
+            self.recent.touch(value)
+
+        return value
+
+    def compute(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        self.stats.misses += 1
+
+        manager = cache_manager.active if self.managed else None
+
+        if manager is None:
+            return self.lookup(instance, owner)
+
+        start = perf_counter()
+        value = self.lookup(instance, owner)
+        cost = perf_counter() - start
+
+        manager.track(
+            self, self.receiver(instance, owner), owner, value, cost, self.priority
+        )
+
+        return value
+
+    def lookup(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        if self.key_cache is None:
+            return self.evaluate(instance, owner)
+
+        stamp = self.stamp()
+
+        # Shared values are dropped together, the first time they're needed in an epoch
+        if stamp != self.key_cache_stamp:
+            self.key_cache.clear()
+            self.key_cache_stamp = stamp
+
+        # Share values between receivers with the same key
+        key = self.cache_key(instance, owner)
+        value = self.key_cache.get(key, Uncached())
+
+        if isinstance(value, Uncached):
+            value = self.evaluate(instance, owner)
+            self.key_cache[key] = value
+        elif self.eager:
+            pending = self.pop_pending(instance, owner)
+
+            if pending is not None:
+                pending.cancel()
+
+        return value
+
+    def evaluate(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        pending = self.pop_pending(instance, owner) if self.eager else None
+
+        if pending is not None:
+            # Re-raises any exception from the background computation
+            value: VT = pending.result()
+
+            if self.current_epoch is not None:
+                stamped: Stamped = value  # type: ignore
+
+                value = (
+                    stamped.value
+                    if stamped.number == self.current_epoch.number
+                    else super().__get__(instance, owner)
+                )
+        else:
+            value = super().__get__(instance, owner)
+
+        if self.intern_table is not None:
+            value = self.intern_table.intern(value)
+
+        return value
+
+    def receiver(self, instance: Optional[OT], owner: Type[OT]) -> Any:
+        return instance
+
+    def cache_key(self, instance: Optional[OT], owner: Type[OT]) -> Hashable:
+        return self.key(instance)  # type: ignore
+
+    def touch(self, instance: Optional[OT], owner: Type[OT]) -> None:
+        manager = cache_manager.active
+
+        if manager is not None and self.managed:
+            manager.touch(self, self.receiver(instance, owner))
+
+    def forget(self, instance: Optional[OT], owner: Type[OT]) -> None:
+        manager = cache_manager.active
+
+        if manager is not None and self.managed:
+            manager.forget(self, self.receiver(instance, owner))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Discard the value shared by receivers with the given key"""
+        if self.key_cache is None:
+            raise TypeError(f"Property {self!r} has no key")
+
+        self.key_cache.pop(key)
+
+    def submit(self, instance: Optional[OT], owner: Type[OT]) -> "Future[VT]":
+        executor = self.executor if self.executor is not None else default_executor()
+
+        return executor.submit(self.background, instance, owner)
+
+    def background(self, instance: Optional[OT], owner: Type[OT]) -> Any:
+        stamp = self.stamp()
+        value = super().__get__(instance, owner)
+
+        # Computed before the epoch was bumped, the value is stale when used
+        return Stamped(stamp, value) if stamp is not None else value
+
+    def precompute(self, instance: OT) -> None:
+        owner = type(instance)
+
+        if self.name is None or resolve(owner, self.name) is not self:
+            return
+
+        instance.__dict__[self.pending_name] = Pending(self.submit(instance, owner))
+
+    def write(self, instance: Optional[OT], owner: Type[OT], value: VT) -> None:
+        if self.storage is not None:
+            self.storage.save(instance, self.store(value, self.stamp()))
+        else:
+            instance.__dict__[self.cache_name] = self.store(value, self.stamp())
+
+    def pop_pending(
+        self, instance: Optional[OT], owner: Type[OT]
+    ) -> "Optional[Future[VT]]":
+        if not self.eager:
+            return None
+
+        pending: Optional[Pending] = instance.__dict__.pop(self.pending_name, None)
+
+        return pending.future if pending is not None else None
+
+    def transient_names(self) -> List[str]:
+        """Names of the instance attributes of caches to exclude from pickles"""
+        names = []
+
+        if not self.persist:
+            names.append(self.cache_name)
+
+        # Background computations can't be transferred
+        if self.eager:
+            names.append(self.pending_name)
+
+        return names
+
     @property
     def clear_cache(self) -> Deleter[OT]:
         def clear_cache(instance: OT) -> None:
-            cache_name = self.cache_name
+            if self.storage is not None:
+                self.storage.discard(instance)
+            elif self.cache_name in instance.__dict__:
+                delattr(instance, self.cache_name)
+
+            pending = self.pop_pending(instance, type(instance))
 
-            if cache_name in instance.__dict__:
-                delattr(instance, cache_name)
+            if pending is not None:
+                pending.cancel()
+
+            self.forget(instance, type(instance))
 
         # Mypy doesn't recognize functions as Getable
         return clear_cache  # type: ignore
@@ -71,20 +505,68 @@ class CachedProperty(NamedProperty[OT, VT]):
 
 @dataclass
 class CachedClassProperty(CachedProperty[OT, VT], ClassProperty[OT, VT]):
+    def __set_name__(self, owner: Type[OT], name: str) -> None:
+        super(CachedProperty, self).__set_name__(owner, name)
+
+        class_cache_owners.add(owner)
+
+        if self.eager:
+            self.precompute(owner)
+            add_subclass_hook(owner, self.precompute)
+
     def __get__(self, instance: Optional[OT], owner: Type[OT]) -> VT:
         cache_name = self.cache_name
+        value = owner.__dict__.get(cache_name, _missing)
+
+        if value is not _missing:
+            if cache_manager.active is not None:
+                self.touch(instance, owner)
 
-        if cache_name in owner.__dict__:
-            value: VT = owner.__dict__[cache_name]
+            if type(value) is not WeakValue and type(value) is not Stamped:
+                return value
 
-            return value
+            value = self.unwrap(value)
 
-        value = super(CachedProperty, self).__get__(instance, owner)
+            if not isinstance(value, Uncached):
+                return value
 
-        setattr(owner, cache_name, value)
+        stamp = self.stamp()
+        value = self.compute(instance, owner)
+
+        setattr(owner, cache_name, self.store(value, stamp))
 
         return value
 
+    def receiver(self, instance: Optional[OT], owner: Type[OT]) -> Any:
+        return owner
+
+    def cache_key(self, instance: Optional[OT], owner: Type[OT]) -> Hashable:
+        return self.key(owner)  # type: ignore
+
+    def precompute(self, owner: Type[OT]) -> None:  # type: ignore
+        if self.name is None or resolve(owner, self.name) is not self:
+            return
+
+        setattr(owner, self.pending_name, self.submit(None, owner))
+
+    def write(self, instance: Optional[OT], owner: Type[OT], value: VT) -> None:
+        setattr(owner, self.cache_name, self.store(value, self.stamp()))
+
+    def pop_pending(
+        self, instance: Optional[OT], owner: Type[OT]
+    ) -> "Optional[Future[VT]]":
+        pending_name = self.pending_name
+        pending: "Optional[Future[VT]]" = owner.__dict__.get(pending_name)
+
+        if pending is not None:
+            delattr(owner, pending_name)
+
+        return pending
+
+    def transient_names(self) -> List[str]:
+        # Class level caches aren't stored on instances
+        return []
+
     @property
     def clear_cache(self) -> Deleter[OT]:
         def clear_cache(owner: Type[OT]) -> None:
@@ -93,27 +575,92 @@ class CachedClassProperty(CachedProperty[OT, VT], ClassProperty[OT, VT]):
             if cache_name in owner.__dict__:
                 delattr(owner, cache_name)
 
+            pending = self.pop_pending(None, owner)
+
+            if pending is not None:
+                pending.cancel()
+
+            self.forget(None, owner)
+
         return classmethod(clear_cache)
 
 
 @dataclass
 class CachedStaticProperty(CachedProperty[OT, VT], StaticProperty[OT, VT]):
     value: Cache[VT] = Uncached()
+    pending: "Optional[Future[VT]]" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __set_name__(self, owner: Type[OT], name: str) -> None:
+        super(CachedProperty, self).__set_name__(owner, name)
+
+        class_cache_owners.add(owner)
+
+        if self.eager:
+            self.pending = self.submit(None, owner)
 
     def __get__(self, instance: Optional[OT], owner: Type[OT]) -> VT:
-        if isinstance(self.value, Uncached):
-            self.value = super(CachedProperty, self).__get__(instance, owner)
+        value = self.value
+
+        if type(value) is WeakValue or type(value) is Stamped:
+            value = self.unwrap(value)
+
+        if isinstance(value, Uncached):
+            stamp = self.stamp()
+            value = self.compute(instance, owner)
+
+            self.value = self.store(value, stamp)
+        elif cache_manager.active is not None:
+            self.touch(instance, owner)
+
+        return value
+
+    def receiver(self, instance: Optional[OT], owner: Type[OT]) -> Any:
+        return None
 
-        return self.value
+    def write(self, instance: Optional[OT], owner: Type[OT], value: VT) -> None:
+        self.value = self.store(value, self.stamp())
+
+    def pop_pending(
+        self, instance: Optional[OT], owner: Type[OT]
+    ) -> "Optional[Future[VT]]":
+        pending, self.pending = self.pending, None
+
+        return pending
+
+    def transient_names(self) -> List[str]:
+        return []
 
     @property
     def clear_cache(self) -> Deleter[OT]:
         def clear_cache() -> None:
             self.value = Uncached()
 
+            pending, self.pending = self.pending, None
+
+            if pending is not None:
+                pending.cancel()
+
+            self.forget(None, type(None))  # type: ignore
+
         return staticmethod(clear_cache)
 
 
+def cached_properties(owner: type) -> "Dict[str, CachedProperty[Any, Any]]":
+    """All cached properties visible on `owner`, by name"""
+    properties: "Dict[str, CachedProperty[Any, Any]]" = {}
+
+    for base in reversed(owner.__mro__):
+        for name, attr in base.__dict__.items():
+            if isinstance(attr, CachedProperty):
+                properties[name] = attr
+            else:
+                properties.pop(name, None)
+
+    return properties
+
+
 cached_property = CachedProperty
 cached_class_property = CachedClassProperty
 cached_static_property = CachedStaticProperty
@@ -17,12 +17,13 @@ class ClassProperty(WrappedProperty[OT, VT]):
     wrapper = classmethod
 
     def __post_init__(self) -> None:
-        fget = self.__dict__["fget"]
+        super().__post_init__()
 
-        if isinstance(fget, self.wrapper):
-            fget.__doc__ = fget.__func__.__doc__
+        fget = self.__dict__["fget"]
 
-        super().__post_init__()
+        # Before Python 3.10, classmethod and staticmethod don't take the docstring
+        if self.doc is None and fget is not None:
+            self.__doc__ = fget.__func__.__doc__
 
 
 class StaticProperty(ClassProperty[OT, VT]):
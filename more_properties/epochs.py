@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict
+
+__all__ = [
+    "Epoch",
+    "get_epoch",
+    "bump_epoch",
+]
+
+
+@dataclass
+class Epoch:
+    """A named counter, bumped to invalidate all values cached in earlier epochs"""
+
+    name: str
+    number: int = 0
+
+
+_epochs: Dict[str, Epoch] = {}
+_lock = Lock()
+
+
+def get_epoch(name: str) -> Epoch:
+    with _lock:
+        epoch = _epochs.get(name)
+
+        if epoch is None:
+            epoch = _epochs[name] = Epoch(name)
+
+        return epoch
+
+
+def bump_epoch(name: str) -> None:
+    """Invalidate all values cached by properties with `epoch=name`, in constant time
+
+    Values are recomputed on their next access.
+    """
+    epoch = get_epoch(name)
+
+    with _lock:
+        epoch.number += 1
@@ -0,0 +1,137 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+from weakref import WeakKeyDictionary, WeakSet
+
+from more_properties.cached_property import (
+    CachedClassProperty,
+    CachedProperty,
+    CachedStaticProperty,
+    cached_properties,
+    class_cache_owners,
+)
+from more_properties.hooks import add_subclass_hook, resolve
+from more_properties.local_property import ScopedCachedProperty
+from more_properties.module_property import class_module
+
+__all__ = [
+    "freeze",
+    "freeze_all",
+    "unfreeze",
+    "unfreeze_all",
+]
+
+
+@dataclass
+class Frozen:
+    prop: "CachedProperty[Any, Any]"
+    classes: "WeakSet[type]" = field(default_factory=WeakSet)
+
+
+# Frozen properties, by the class defining them
+_frozen: "WeakKeyDictionary[type, Dict[str, Frozen]]" = WeakKeyDictionary()
+
+
+def _subclasses(owner: type) -> Iterator[type]:
+    subclasses: List[type] = type.__subclasses__(owner)
+
+    for subclass in subclasses:
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _is_freezable(prop: Any) -> bool:
+    # Scoped values differ between threads and contexts, so have no single value to freeze
+    return isinstance(
+        prop, (CachedClassProperty, CachedStaticProperty)
+    ) and not isinstance(prop, ScopedCachedProperty)
+
+
+def _set_frozen_value(owner: type, name: str, frozen: Frozen) -> None:
+    value = frozen.prop.__get__(None, owner)
+
+    module = class_module(owner)
+
+    if module is not None:
+        # Modules hold their attributes themselves, shadowing their class
+        module.__dict__[name] = value
+    else:
+        setattr(owner, name, value)
+
+    frozen.classes.add(owner)
+
+
+def _freeze_subclass(owner: type) -> None:
+    for defining_class in owner.__mro__[1:]:
+        for name, frozen in _frozen.get(defining_class, {}).items():
+            if not isinstance(frozen.prop, CachedClassProperty):
+                continue
+
+            # Only if the value would otherwise be inherited from a frozen class
+            base = next(base for base in owner.__mro__ if name in base.__dict__)
+
+            if base in frozen.classes:
+                _set_frozen_value(owner, name, frozen)
+
+
+def _freeze(owner: type, name: str, prop: "CachedProperty[Any, Any]") -> None:
+    if owner not in _frozen:
+        _frozen[owner] = {}
+        add_subclass_hook(owner, _freeze_subclass)
+
+    frozen = _frozen[owner][name] = Frozen(prop)
+
+    # Each class has its own value of a class property
+    if isinstance(prop, CachedClassProperty):
+        for subclass in _subclasses(owner):
+            if resolve(subclass, name) is prop:
+                _set_frozen_value(subclass, name, frozen)
+
+    _set_frozen_value(owner, name, frozen)
+
+    if class_module(owner) is not None:
+        delattr(owner, name)
+
+
+def freeze(owner: type) -> None:
+    """Replace the class level cached properties of `owner` with their values
+
+    Properties are replaced throughout the class hierarchy in which they're defined.
+    """
+    for name, prop in cached_properties(owner).items():
+        if _is_freezable(prop):
+            defining_class = next(
+                base for base in owner.__mro__ if base.__dict__.get(name) is prop
+            )
+
+            _freeze(defining_class, name, prop)
+
+
+def freeze_all() -> None:
+    """Replace all class level cached properties with their values"""
+    for owner in list(class_cache_owners):
+        freeze(owner)
+
+
+def _unfreeze(owner: type) -> None:
+    for name, frozen in _frozen.pop(owner, {}).items():
+        for cls in list(frozen.classes):
+            module = class_module(cls)
+
+            if module is not None:
+                module.__dict__[name] = frozen.prop
+            elif name in cls.__dict__:
+                delattr(cls, name)
+
+        setattr(owner, name, frozen.prop)
+
+
+def unfreeze(owner: type) -> None:
+    """Restore the class level cached properties of `owner` that were frozen"""
+    for base in owner.__mro__:
+        _unfreeze(base)
+
+
+def unfreeze_all() -> None:
+    """Restore all class level cached properties that were frozen"""
+    for owner in list(_frozen):
+        _unfreeze(owner)
@@ -0,0 +1,107 @@
+from functools import wraps
+from typing import Any, Callable, List, Type, TypeVar
+
+__all__ = [
+    "add_init_hook",
+    "add_subclass_hook",
+    "resolve",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+
+InitHook = Callable[[OT], None]
+SubclassHook = Callable[[Type[OT]], None]
+
+_INIT_HOOKS = "__init_hooks__"
+_SUBCLASS_HOOKS = "__subclass_hooks__"
+_INIT_WRAPPED = "__init_wrapped__"
+
+
+def resolve(owner: type, name: str) -> Any:
+    """Find the class attribute `name` on `owner`, without invoking descriptors"""
+    for base in owner.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+
+    return None
+
+
+def _hooks(owner: type, hooks_name: str) -> List[Callable[[Any], None]]:
+    hooks: List[Callable[[Any], None]] = []
+
+    for base in reversed(owner.__mro__):
+        hooks.extend(base.__dict__.get(hooks_name, ()))
+
+    return hooks
+
+
+def _wrap_init(cls: type) -> None:
+    original_init = cls.__init__  # type: ignore
+
+    @wraps(original_init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        # Arguments are for __new__, which object.__init__ only ignores if not replaced
+        if original_init is object.__init__:
+            original_init(self)
+        else:
+            original_init(self, *args, **kwargs)
+
+        # Subclass initializers may chain to ours, so only run hooks once, from the outermost
+        if type(self) is cls:
+            for hook in _hooks(cls, _INIT_HOOKS):
+                hook(self)
+
+    setattr(cls, "__init__", __init__)
+    setattr(cls, _INIT_WRAPPED, True)
+
+
+def _wrap_new(owner: type) -> None:
+    original_new = owner.__dict__.get("__new__")
+
+    def __new__(cls: type, *args: Any, **kwargs: Any) -> Any:
+        # Class decorators, such as dataclass, may replace __init__ after class creation,
+        # so wait until the first instantiation, when __init__ is final, before wrapping it
+        if _INIT_WRAPPED not in cls.__dict__:
+            _wrap_init(cls)
+
+        if original_new is not None:
+            return original_new.__get__(None, cls)(cls, *args, **kwargs)
+
+        base_new = super(owner, cls).__new__  # type: ignore
+
+        if base_new is object.__new__:
+            return base_new(cls)
+
+        return base_new(cls, *args, **kwargs)
+
+    setattr(owner, "__new__", staticmethod(__new__))
+
+
+def add_init_hook(owner: Type[OT], hook: InitHook[OT]) -> None:
+    """Call `hook` with each instance of `owner`, or its subclasses, once initialized"""
+    if _INIT_HOOKS not in owner.__dict__:
+        setattr(owner, _INIT_HOOKS, [])
+        _wrap_new(owner)
+
+    owner.__dict__[_INIT_HOOKS].append(hook)
+
+
+def add_subclass_hook(owner: Type[OT], hook: SubclassHook[OT]) -> None:
+    """Call `hook` with each subclass of `owner`, once defined"""
+    if _SUBCLASS_HOOKS not in owner.__dict__:
+        setattr(owner, _SUBCLASS_HOOKS, [])
+
+        original_init_subclass = owner.__dict__.get("__init_subclass__")
+
+        def __init_subclass__(cls: type, **kwargs: Any) -> None:
+            if original_init_subclass is not None:
+                original_init_subclass.__get__(None, cls)(**kwargs)
+            else:
+                super(owner, cls).__init_subclass__(**kwargs)  # type: ignore
+
+            for hook in owner.__dict__[_SUBCLASS_HOOKS]:
+                hook(cls)
+
+        setattr(owner, "__init_subclass__", classmethod(__init_subclass__))
+
+    owner.__dict__[_SUBCLASS_HOOKS].append(hook)
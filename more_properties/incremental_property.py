@@ -0,0 +1,117 @@
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Hashable, List, Optional, Tuple, Type, TypeVar
+
+from more_properties.cached_property import CachedProperty
+from more_properties.types import Deleter, Uncached
+
+__all__ = [
+    "incremental_cached_property",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+VT = TypeVar("VT")  # Value Type
+
+Cursor = Callable[[OT], Hashable]
+Updater = Callable[[OT, VT, Hashable], VT]
+
+
+@dataclass
+class IncrementalCachedProperty(CachedProperty[OT, VT]):
+    """Updates the value cleared from the cache, rather than recomputing it
+
+    `fcursor` gives a token of the state the value is computed from,
+    such as the length of a list, taken before computing.
+    `fupdate` is given the previous value and the cursor it was computed at,
+    and returns the new value, or `NotImplemented` to recompute it from scratch.
+    """
+
+    fcursor: "Optional[Cursor[OT]]" = None
+    fupdate: "Optional[Updater[OT, VT]]" = None
+
+    # Cleared values are kept to update from, so clearing them doesn't free memory
+    managed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.eager or self.storage is not None:
+            raise ValueError("Incremental cached properties can't be eager or stored")
+
+        super().__post_init__()
+
+    @property
+    def cursor_name(self) -> str:
+        if self.name is None:
+            raise AttributeError(f"Property {self!r} not assigned to class")
+
+        return f"__{self.name}_cursor"
+
+    @property
+    def previous_name(self) -> str:
+        if self.name is None:
+            raise AttributeError(f"Property {self!r} not assigned to class")
+
+        return f"__{self.name}_previous"
+
+    def cursor(self, func: "Cursor[OT]") -> "IncrementalCachedProperty[OT, VT]":
+        return replace(self, fcursor=func)
+
+    def updater(self, func: "Updater[OT, VT]") -> "IncrementalCachedProperty[OT, VT]":
+        return replace(self, fupdate=func)
+
+    def current_cursor(self, instance: Optional[OT], owner: Type[OT]) -> Hashable:
+        fcursor = self.__dict__["fcursor"]
+
+        return fcursor.__get__(instance, owner)() if fcursor is not None else None
+
+    def evaluate(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        cursor = self.current_cursor(instance, owner)
+        previous: Optional[Tuple[VT, Hashable]] = instance.__dict__.pop(
+            self.previous_name, None
+        )
+
+        value: Any = NotImplemented
+        fupdate = self.__dict__["fupdate"]
+
+        if previous is not None and fupdate is not None:
+            value = fupdate.__get__(instance, owner)(*previous)
+
+        if value is NotImplemented:
+            value = super().evaluate(instance, owner)
+        elif self.intern_table is not None:
+            value = self.intern_table.intern(value)
+
+        instance.__dict__[self.cursor_name] = cursor
+
+        return value  # type: ignore
+
+    def write(self, instance: Optional[OT], owner: Type[OT], value: VT) -> None:
+        instance.__dict__[self.cursor_name] = self.current_cursor(instance, owner)
+
+        super().write(instance, owner, value)
+
+    def transient_names(self) -> List[str]:
+        names = super().transient_names()
+
+        if not self.persist:
+            names.extend([self.cursor_name, self.previous_name])
+
+        return names
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        # Mypy unwraps the descriptor recursively, while Python only does it once
+        clear_value: Deleter[OT] = super().clear_cache  # type: ignore
+
+        def clear_cache(instance: OT) -> None:
+            cache = instance.__dict__
+            value = self.unwrap(cache.get(self.cache_name, Uncached()))
+
+            if not isinstance(value, Uncached) and self.cursor_name in cache:
+                cache[self.previous_name] = (value, cache[self.cursor_name])
+
+            clear_value(instance)  # type: ignore
+
+        # Mypy doesn't recognize functions as Getable
+        return clear_cache  # type: ignore
+
+
+incremental_cached_property = IncrementalCachedProperty
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from math import copysign
+from threading import Lock
+from typing import Any, Hashable, TypeVar
+from weakref import WeakKeyDictionary, ref
+
+__all__ = ["InternTable"]
+
+VT = TypeVar("VT")  # Value Type
+
+
+def _typed_key(value: Hashable) -> Hashable:
+    """A key equal only for values of the same types, throughout any containers
+
+    Equal values of different types, such as 1 and 1.0, aren't interchangeable.
+    """
+    if isinstance(value, tuple):
+        return type(value), tuple(_typed_key(item) for item in value)
+
+    if isinstance(value, frozenset):
+        return type(value), frozenset(_typed_key(item) for item in value)
+
+    if isinstance(value, float):
+        # Distinguishes 0.0 and -0.0
+        return type(value), value, copysign(1.0, value)
+
+    return type(value), value
+
+
+@dataclass
+class InternTable:
+    """Deduplicates equal values, so they may share a single object
+
+    Weakly referenceable values are held weakly.
+    Other values are held strongly, with only the `size` most recently used kept.
+    """
+
+    size: int = 4096
+    lookups: int = field(default=0, init=False)
+    hits: int = field(default=0, init=False)
+    weak_values: "WeakKeyDictionary[Any, ref[Any]]" = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+    strong_values: "OrderedDict[Hashable, Any]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Proportion of values replaced by an existing equal value"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def intern(self, value: VT) -> VT:
+        try:
+            hash(value)
+        except TypeError:
+            return value
+
+        with self.lock:
+            self.lookups += 1
+
+            try:
+                return self._intern_weak(value)
+            except TypeError:
+                return self._intern_strong(value)
+
+    def _intern_weak(self, value: VT) -> VT:
+        value_ref = self.weak_values.get(value)
+        existing = value_ref() if value_ref is not None else None
+
+        if existing is not None and _typed_key(existing) == _typed_key(value):
+            self.hits += 1
+            return existing
+
+        self.weak_values[value] = ref(value)
+
+        return value
+
+    def _intern_strong(self, value: VT) -> VT:
+        key = _typed_key(value)
+        existing = self.strong_values.get(key, value)
+
+        if existing is not value:
+            self.hits += 1
+            self.strong_values.move_to_end(key)
+            return existing
+
+        self.strong_values[key] = value
+        self.strong_values.move_to_end(key)
+
+        while len(self.strong_values) > self.size:
+            self.strong_values.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        with self.lock:
+            self.weak_values.clear()
+            self.strong_values.clear()
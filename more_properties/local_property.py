@@ -0,0 +1,310 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from threading import RLock, local
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    List,
+    MutableMapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary, finalize
+
+from more_properties.cached_property import (
+    CachedClassProperty,
+    CachedProperty,
+    CachedStaticProperty,
+)
+from more_properties.types import Deleter
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python 3.6, without the contextvars backport
+    ContextVar = None  # type: ignore
+
+__all__ = [
+    "thread_local_cached_property",
+    "thread_local_cached_class_property",
+    "thread_local_cached_static_property",
+    "context_cached_property",
+    "context_cached_class_property",
+    "context_cached_static_property",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+VT = TypeVar("VT")  # Value Type
+
+Release = Callable[[VT], None]
+
+
+class Holder(Generic[VT]):
+    """Holds a cached value, releasing it once no scope holds it"""
+
+    __slots__ = ("value", "stamp", "__weakref__")
+
+    def __init__(
+        self, value: VT, release: "Optional[Release[VT]]", stamp: Optional[int]
+    ) -> None:
+        self.value = value
+        self.stamp = stamp
+
+        if release is not None:
+            finalize(self, release, value)
+
+
+class Scope(ABC, Generic[VT]):
+    @classmethod
+    def new_state(cls, name: str) -> Any:
+        """State shared by the scopes of all receivers of a property"""
+        return None
+
+    def __init__(self, state: Any) -> None:
+        pass
+
+    @abstractmethod
+    def get(self) -> Optional[Holder[VT]]:
+        ...
+
+    @abstractmethod
+    def set(self, holder: Optional[Holder[VT]]) -> None:
+        ...
+
+
+class ThreadScope(Scope[VT]):
+    """Holds a value per thread, dropped when the thread ends"""
+
+    def __init__(self, state: Any) -> None:
+        super().__init__(state)
+
+        self.local = local()
+
+    def get(self) -> Optional[Holder[VT]]:
+        return getattr(self.local, "holder", None)
+
+    def set(self, holder: Optional[Holder[VT]]) -> None:
+        self.local.holder = holder
+
+
+# Values by scope, keyed weakly
+Holders = MutableMapping[Any, Holder[Any]]
+
+
+class Frame:
+    """The values of a context variable, with the token of the context that set them"""
+
+    __slots__ = ("holders", "token")
+
+    def __init__(self, holders: Holders) -> None:
+        self.holders = holders
+        self.token: Any = None
+
+
+# Guards frames written in place, against copying them from another thread
+_frames_lock = RLock()
+
+
+class ContextScope(Scope[VT]):
+    """Holds a value per context, dropped when no context refers to it
+
+    The values of all receivers of a property are held in one context variable,
+    keyed weakly by scope, so are dropped along with their receivers.
+    """
+
+    @classmethod
+    def new_state(cls, name: str) -> "ContextVar[Optional[Frame]]":
+        if ContextVar is None:
+            raise RuntimeError("Context scoped caches require contextvars")
+
+        return ContextVar(name)
+
+    def __init__(self, state: "ContextVar[Optional[Frame]]") -> None:
+        super().__init__(state)
+
+        self.var = state
+
+    def get(self) -> Optional[Holder[VT]]:
+        frame = self.var.get(None)
+
+        return frame.holders.get(self) if frame is not None else None
+
+    def set(self, holder: Optional[Holder[VT]]) -> None:
+        with _frames_lock:
+            frame = self.var.get(None)
+
+            # Copied contexts share the values cached before copying, so copy on write
+            if frame is None or not self.owns(frame):
+                frame = Frame(WeakKeyDictionary(frame.holders if frame else ()))
+
+            if holder is not None:
+                frame.holders[self] = holder
+            else:
+                frame.holders.pop(self, None)
+
+            frame.token = self.var.set(frame)
+
+    def owns(self, frame: Frame) -> bool:
+        """Whether the current context set `frame`, rather than inheriting it"""
+        # Tokens can only be reset in the context that made them
+        try:
+            self.var.reset(frame.token)
+        except (ValueError, RuntimeError):
+            return False
+
+        return True
+
+
+@dataclass
+class ScopedCachedProperty(CachedProperty[OT, VT]):
+    scope_type: ClassVar[type] = Scope
+
+    release: "Optional[Release[VT]]" = None
+
+    # Caches are cleared per thread or context, so can't be evicted from elsewhere
+    managed: bool = False
+
+    scope_state: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.eager:
+            raise ValueError("Scoped cached properties can't be eager")
+
+        super().__post_init__()
+
+    def new_scope(self, owner: Type[OT]) -> Scope[VT]:
+        if self.scope_state is None:
+            name = f"{owner.__qualname__}.{self.name}"
+            self.scope_state = self.scope_type.new_state(name)  # type: ignore
+
+        scope: Scope[VT] = self.scope_type(self.scope_state)
+
+        return scope
+
+    def scope(self, instance: Optional[OT], owner: Type[OT]) -> Scope[VT]:
+        cache_name = self.cache_name
+
+        try:
+            scope: Scope[VT] = instance.__dict__[cache_name]
+        except KeyError:
+            scope = instance.__dict__.setdefault(cache_name, self.new_scope(owner))
+
+        return scope
+
+    def __get__(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        scope = self.scope(instance, owner)
+        holder = scope.get()
+
+        if holder is None or holder.stamp != self.stamp():
+            stamp = self.stamp()
+            holder = Holder(self.compute(instance, owner), self.release, stamp)
+            scope.set(holder)
+
+        return holder.value
+
+    def write(self, instance: Optional[OT], owner: Type[OT], value: VT) -> None:
+        self.scope(instance, owner).set(Holder(value, self.release, self.stamp()))
+
+    def transient_names(self) -> List[str]:
+        # Scoped values belong to the thread or context that made them
+        return [self.cache_name]
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        def clear_cache(instance: OT) -> None:
+            scope = instance.__dict__.get(self.cache_name)
+
+            if scope is not None:
+                scope.set(None)
+
+        # Mypy doesn't recognize functions as Getable
+        return clear_cache  # type: ignore
+
+
+@dataclass
+class ScopedCachedClassProperty(
+    ScopedCachedProperty[OT, VT], CachedClassProperty[OT, VT]
+):
+    def scope(self, instance: Optional[OT], owner: Type[OT]) -> Scope[VT]:
+        cache_name = self.cache_name
+
+        try:
+            scope: Scope[VT] = owner.__dict__[cache_name]
+        except KeyError:
+            scope = self.new_scope(owner)
+            setattr(owner, cache_name, scope)
+
+        return scope
+
+    def transient_names(self) -> List[str]:
+        return []
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        def clear_cache(owner: Type[OT]) -> None:
+            scope = owner.__dict__.get(self.cache_name)
+
+            if scope is not None:
+                scope.set(None)
+
+        return classmethod(clear_cache)
+
+
+@dataclass
+class ScopedCachedStaticProperty(
+    ScopedCachedProperty[OT, VT], CachedStaticProperty[OT, VT]
+):
+    static_scope: Optional[Scope[VT]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def scope(self, instance: Optional[OT], owner: Type[OT]) -> Scope[VT]:
+        if self.static_scope is None:
+            self.static_scope = self.new_scope(owner)
+
+        return self.static_scope
+
+    def transient_names(self) -> List[str]:
+        return []
+
+    @property
+    def clear_cache(self) -> Deleter[OT]:
+        def clear_cache() -> None:
+            if self.static_scope is not None:
+                self.static_scope.set(None)
+
+        return staticmethod(clear_cache)
+
+
+class ThreadLocalCachedProperty(ScopedCachedProperty[OT, VT]):
+    scope_type = ThreadScope
+
+
+class ThreadLocalCachedClassProperty(ScopedCachedClassProperty[OT, VT]):
+    scope_type = ThreadScope
+
+
+class ThreadLocalCachedStaticProperty(ScopedCachedStaticProperty[OT, VT]):
+    scope_type = ThreadScope
+
+
+class ContextCachedProperty(ScopedCachedProperty[OT, VT]):
+    scope_type = ContextScope
+
+
+class ContextCachedClassProperty(ScopedCachedClassProperty[OT, VT]):
+    scope_type = ContextScope
+
+
+class ContextCachedStaticProperty(ScopedCachedStaticProperty[OT, VT]):
+    scope_type = ContextScope
+
+
+thread_local_cached_property = ThreadLocalCachedProperty
+thread_local_cached_class_property = ThreadLocalCachedClassProperty
+thread_local_cached_static_property = ThreadLocalCachedStaticProperty
+context_cached_property = ContextCachedProperty
+context_cached_class_property = ContextCachedClassProperty
+context_cached_static_property = ContextCachedStaticProperty
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Generic, Hashable, Optional, TypeVar, Union
+
+__all__ = ["LRUCache"]
+
+KT = TypeVar("KT", bound=Hashable)  # Key Type
+VT = TypeVar("VT")  # Value Type
+DT = TypeVar("DT")  # Default Type
+
+
+@dataclass
+class LRUCache(Generic[KT, VT]):
+    """A mapping holding only the `maxsize` most recently used items
+
+    If `maxsize` is None, the cache is unbounded.
+    """
+
+    maxsize: Optional[int] = 128
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    data: "OrderedDict[KT, VT]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: KT, default: DT = None) -> Union[VT, DT]:  # type: ignore
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self.data.move_to_end(key)
+
+            return value
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(self.data) > self.maxsize:
+                    self.data.popitem(last=False)
+
+    def pop(self, key: KT, default: DT = None) -> Union[VT, DT]:  # type: ignore
+        with self.lock:
+            return self.data.pop(key, default)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
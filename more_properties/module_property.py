@@ -0,0 +1,71 @@
+import sys
+from types import ModuleType
+from typing import Any, Callable, Optional, TypeVar
+from weakref import ref
+
+from more_properties.cached_property import CachedStaticProperty
+from more_properties.class_property import StaticProperty
+
+__all__ = [
+    "module_property",
+    "cached_module_property",
+]
+
+VT = TypeVar("VT")  # Value Type
+PT = TypeVar("PT", bound="StaticProperty[Any, Any]")  # Property Type
+
+_MODULE = "__module_ref__"
+
+
+def module_class(module: ModuleType) -> type:
+    """A class unique to `module`, on which its properties are defined"""
+    cls: type = type(module)
+
+    if _MODULE not in cls.__dict__:
+        cls = type(module.__name__, (cls,), {_MODULE: ref(module)})
+        cls.__module__ = module.__name__
+
+        module.__class__ = cls
+
+    return cls
+
+
+def class_module(cls: type) -> Optional[ModuleType]:
+    """The module that `cls` was made for by `module_class`, if still alive"""
+    module_ref = cls.__dict__.get(_MODULE)
+
+    return module_ref() if module_ref is not None else None
+
+
+def register(module: ModuleType, name: str, prop: PT) -> PT:
+    owner = module_class(module)
+
+    setattr(owner, name, prop)
+
+    # As during class creation
+    set_name = getattr(prop, "__set_name__", None)
+
+    if set_name is not None:
+        set_name(owner, name)
+
+    return prop
+
+
+def module_property(
+    fget: Callable[[], VT], **kwargs: Any
+) -> "StaticProperty[Any, VT]":
+    """Define a property of the module in which `fget` is defined"""
+    return register(
+        sys.modules[fget.__module__], fget.__name__, StaticProperty(fget, **kwargs)
+    )
+
+
+def cached_module_property(
+    fget: Callable[[], VT], **kwargs: Any
+) -> "CachedStaticProperty[Any, VT]":
+    """Define a cached property of the module in which `fget` is defined"""
+    return register(
+        sys.modules[fget.__module__],
+        fget.__name__,
+        CachedStaticProperty(fget, **kwargs),
+    )
@@ -0,0 +1,76 @@
+from typing import Any, FrozenSet, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from more_properties.cached_method import CachedMethod
+from more_properties.cached_property import Stamped, WeakValue, cached_properties
+
+__all__ = [
+    "exclude_caches",
+    "transient_cache_names",
+]
+
+T = TypeVar("T", bound=type)
+
+_transient_cache_names: "WeakKeyDictionary[type, FrozenSet[str]]" = WeakKeyDictionary()
+
+
+def transient_cache_names(owner: type) -> FrozenSet[str]:
+    """Names of the instance attributes used by non-persisted caches of `owner`"""
+    try:
+        return _transient_cache_names[owner]
+    except KeyError:
+        pass
+
+    names = set()
+
+    for prop in cached_properties(owner).values():
+        names.update(prop.transient_names())
+
+    for base in owner.__mro__:
+        for attr in base.__dict__.values():
+            if isinstance(attr, CachedMethod):
+                names.update(attr.transient_names())
+
+    transient_names = _transient_cache_names[owner] = frozenset(names)
+
+    return transient_names
+
+
+def _exclude(instance: Any, state: Any) -> Any:
+    if not isinstance(state, dict):
+        return state
+
+    transient_names = transient_cache_names(type(instance))
+
+    return {
+        name: value
+        for name, value in state.items()
+        if name not in transient_names
+        and type(value) is not WeakValue
+        and type(value) is not Stamped
+    }
+
+
+def exclude_caches(cls: T) -> T:
+    """Exclude cached values from the pickles and copies of instances of `cls`
+
+    Only values of cached properties with `persist=True` are kept.
+    """
+    original_getstate = cls.__dict__.get("__getstate__")
+
+    def __getstate__(self: Any) -> Any:
+        if original_getstate is not None:
+            state = original_getstate(self)
+        else:
+            base_getstate = getattr(super(cls, self), "__getstate__", None)
+            state = base_getstate() if base_getstate is not None else self.__dict__
+
+        # Slotted objects have state (__dict__, slots)
+        if isinstance(state, tuple) and len(state) == 2:
+            return _exclude(self, state[0]), state[1]
+
+        return _exclude(self, state)
+
+    setattr(cls, "__getstate__", __getstate__)
+
+    return cls
@@ -0,0 +1,507 @@
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field
+from itertools import repeat
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from weakref import ref
+
+from more_properties.hooks import add_subclass_hook, resolve
+from more_properties.lru import LRUCache
+from more_properties.types import Uncached
+
+__all__ = [
+    "CacheStorage",
+    "ColumnarStorage",
+    "SharedKeyStorage",
+    "ExternalStorage",
+]
+
+
+class CacheStorage(ABC):
+    """Where a cached property keeps its values, in place of the instance `__dict__`
+
+    Each storage holds the values of a single property.
+    """
+
+    binding: Optional[Tuple[type, str]] = None
+
+    def bind(self, owner: type, name: str) -> None:
+        binding = self.binding
+
+        if binding is not None and binding != (owner, name):
+            raise ValueError(
+                f"Storage already used by {binding[0].__qualname__}.{binding[1]},"
+                f" so can't be used by {owner.__qualname__}.{name}"
+            )
+
+        self.binding = owner, name
+
+    def coerce(self, value: Any) -> Any:
+        """The value as loaded once saved"""
+        return value
+
+    @abstractmethod
+    def load(self, instance: Any) -> Any:
+        ...
+
+    @abstractmethod
+    def save(self, instance: Any, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def discard(self, instance: Any) -> None:
+        ...
+
+
+_ROWS = "__rows__"
+_SHARED_CACHE_NAMES = "__shared_cache_names__"
+
+_unset = Uncached()
+
+# Markers in the row table, never the identity of an object, as objects are aligned
+_EMPTY = 0
+_DELETED = 1
+
+# Identities of collected instances gathered before their rows are freed
+_REAP_SIZE = 1024
+
+# Fibonacci hashing, spreading identities, which are mostly sequential, over the table
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+def _slot(key: int, shift: int) -> int:
+    return ((key * _MULTIPLIER) & _MASK_64) >> shift
+
+
+@dataclass
+class Column:
+    typecode: str
+    values: array = field(init=False)
+    valid: bytearray = field(default_factory=bytearray, init=False)
+
+    def __post_init__(self) -> None:
+        self.values = array(self.typecode)
+
+    def get(self, row: int) -> Any:
+        # Read in the opposite order to which they're replaced as the column grows
+        valid = self.valid
+        values = self.values
+
+        if row >> 3 < len(valid) and valid[row >> 3] & (1 << (row & 7)):
+            return values[row]
+
+        return Uncached()
+
+    def set(self, row: int, value: Any) -> None:
+        size = len(self.values)
+
+        if row >= size:
+            grow_by = max(row + 1, 2 * size, 8) - size
+
+            # Grown into copies, as views of the current ones may be held
+            values = array(self.typecode, self.values)
+            values.extend(repeat(0, grow_by))
+
+            valid = bytearray(self.valid)
+            valid.extend(bytes(max(len(values) // 8 + 1 - len(valid), 0)))
+
+            self.values = values
+            self.valid = valid
+
+        self.values[row] = value
+        self.valid[row >> 3] |= 1 << (row & 7)
+
+    def invalidate(self, row: int) -> None:
+        if row < len(self.values):
+            self.valid[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+
+def _new_table(capacity: int) -> Tuple[array, array, int]:
+    shift = 64 - (capacity.bit_length() - 1)
+
+    return array("Q", [_EMPTY]) * capacity, array("I", [0]) * capacity, shift
+
+
+@dataclass
+class Rows:
+    """Assigns a compact row index to each instance of a class, reused once it dies
+
+    Rows are found by the identity of each instance, in an open addressing table,
+    so take no space on instances, nor weak references to them.
+    Instead, the class's `__del__` is wrapped to learn when instances die.
+    """
+
+    table: Tuple[array, array, int] = field(default_factory=lambda: _new_table(8))
+    used: int = 0
+    live: int = 0
+    size: int = 0
+    free: List[int] = field(default_factory=list)
+    dead: Set[int] = field(default_factory=set)
+    columns: List[Column] = field(default_factory=list)
+    lock: Lock = field(default_factory=Lock)
+
+    def watch(self, owner: type) -> None:
+        """Learn of the death of instances of `owner`, and its subclasses"""
+        _wrap_del(owner, resolve(owner, "__del__"), self.collected)
+
+        def watch_subclass(cls: type) -> None:
+            # Overrides may not call the original
+            if "__del__" in cls.__dict__:
+                _wrap_del(cls, cls.__dict__["__del__"], self.collected)
+
+        add_subclass_hook(owner, watch_subclass)
+
+    def row(self, instance: Any) -> Optional[int]:
+        key = id(instance)
+        dead = self.dead
+
+        # An instance with this identity died, so its row isn't this instance's
+        if dead and key in dead:
+            return None
+
+        return self._find(key)
+
+    def set(self, instance: Any, column: Column, value: Any) -> None:
+        key = id(instance)
+
+        with self.lock:
+            if self.dead:
+                self._reap()
+
+            row = self._find(key)
+
+            if row is None:
+                row = self.free.pop() if self.free else self._next_row()
+                self._insert(key, row)
+
+            column.set(row, value)
+
+    def invalidate(self, instance: Any, column: Column) -> None:
+        with self.lock:
+            row = self.row(instance)
+
+            if row is not None:
+                column.invalidate(row)
+
+    def collected(self, key: int) -> None:
+        dead = self.dead
+        dead.add(key)
+
+        # Not waiting, as collection may interrupt a thread holding the lock
+        if len(dead) >= _REAP_SIZE and self.lock.acquire(blocking=False):
+            try:
+                self._reap()
+            finally:
+                self.lock.release()
+
+    def _next_row(self) -> int:
+        row = self.size
+        self.size += 1
+
+        return row
+
+    def _find(self, key: int) -> Optional[int]:
+        keys, rows, shift = self.table
+        mask = len(keys) - 1
+        i = ((key * _MULTIPLIER) & _MASK_64) >> shift  # Inlined _slot
+
+        while True:
+            found = keys[i]
+
+            if found == key:
+                return rows[i]
+
+            if found == _EMPTY:
+                return None
+
+            i = (i + 1) & mask
+
+    def _insert(self, key: int, row: int) -> None:
+        if (self.used + 1) * 3 > len(self.table[0]) * 2:
+            self._resize()
+
+        keys, rows, shift = self.table
+        mask = len(keys) - 1
+        i = _slot(key, shift)
+
+        while keys[i] != _EMPTY and keys[i] != _DELETED:
+            i = (i + 1) & mask
+
+        if keys[i] == _EMPTY:
+            self.used += 1
+
+        self.live += 1
+
+        # Found by unlocked lookups once the key is set, so set last
+        rows[i] = row
+        keys[i] = key
+
+    def _remove(self, key: int) -> Optional[int]:
+        keys, rows, shift = self.table
+        mask = len(keys) - 1
+        i = _slot(key, shift)
+
+        while keys[i] != _EMPTY:
+            if keys[i] == key:
+                keys[i] = _DELETED
+                self.live -= 1
+
+                return rows[i]
+
+            i = (i + 1) & mask
+
+        return None
+
+    def _resize(self) -> None:
+        capacity = 8
+
+        while capacity <= self.live * 3:
+            capacity *= 2
+
+        old_keys, old_rows, _ = self.table
+        keys, rows, shift = _new_table(capacity)
+        mask = capacity - 1
+
+        for key, row in zip(old_keys, old_rows):
+            if key != _EMPTY and key != _DELETED:
+                i = _slot(key, shift)
+
+                while keys[i] != _EMPTY:
+                    i = (i + 1) & mask
+
+                rows[i] = row
+                keys[i] = key
+
+        # Replaced at once, so unlocked lookups see either the old or the new table
+        self.table = keys, rows, shift
+        self.used = self.live
+
+    def _reap(self) -> None:
+        for key in list(self.dead):
+            row = self._remove(key)
+
+            if row is not None:
+                for column in self.columns:
+                    column.invalidate(row)
+
+                self.free.append(row)
+
+            # Only once its row is freed, so the identity isn't trusted until then
+            self.dead.discard(key)
+
+
+def _wrap_del(cls: type, original_del: Any, collected: Callable[[int], None]) -> None:
+    def __del__(self: Any) -> None:
+        collected(id(self))
+
+        if original_del is not None:
+            original_del(self)
+
+    setattr(cls, "__del__", __del__)
+
+
+@dataclass
+class ColumnarStorage(CacheStorage):
+    """Stores numeric values of all instances of a class in a single array
+
+    `typecode` is as for the `array` module.
+    Columnar properties of a class, and its subclasses, share each instance's row.
+    """
+
+    typecode: str = "d"
+    rows: Rows = field(init=False, repr=False)
+    column: Column = field(init=False, repr=False)
+
+    def bind(self, owner: type, name: str) -> None:
+        super().bind(owner, name)
+
+        rows = resolve(owner, _ROWS)
+
+        if not isinstance(rows, Rows):
+            rows = Rows()
+            rows.watch(owner)
+            setattr(owner, _ROWS, rows)
+
+        self.rows = rows
+        self.column = Column(self.typecode)
+
+        rows.columns.append(self.column)
+
+    def load(self, instance: Any) -> Any:
+        row = self.rows.row(instance)
+
+        if row is None:
+            return Uncached()
+
+        return self.column.get(row)
+
+    def save(self, instance: Any, value: Any) -> None:
+        # Checked before a row is assigned
+        self.rows.set(instance, self.column, self.coerce(value))
+
+    def discard(self, instance: Any) -> None:
+        self.rows.invalidate(instance, self.column)
+
+    def coerce(self, value: Any) -> Any:
+        try:
+            return array(self.typecode, (value,))[0]
+        except (TypeError, OverflowError) as e:
+            raise type(e)(
+                f"Columnar storage of type code {self.typecode!r} can't hold {value!r}"
+            ) from e
+
+    def values(self) -> memoryview:
+        """A view of the values of all rows, without copying
+
+        Values of rows not marked as valid are meaningless.
+        Once the column grows, the view no longer sees values as they're cached.
+        """
+        return memoryview(self.column.values)
+
+    def validity(self) -> memoryview:
+        """A bitmap of which rows hold values, least significant bit first"""
+        return memoryview(self.column.valid)
+
+    def to_numpy(self) -> Any:
+        """The values of all rows, as a NumPy masked array, without copying them"""
+        import numpy  # type: ignore
+
+        # Taken together, so the values and their validity are of the same column
+        column_values, column_valid = self.column.values, self.column.valid
+
+        values = numpy.frombuffer(column_values, dtype=column_values.typecode)
+        valid = numpy.unpackbits(
+            numpy.frombuffer(column_valid, dtype=numpy.uint8), bitorder="little"
+        )[: len(values)]
+
+        return numpy.ma.masked_array(values, mask=~valid.astype(bool))
+
+
+@dataclass
+class SharedKeyStorage(CacheStorage):
+    """Stores values in the instance `__dict__`, keeping it key-sharing (PEP 412)
+
+    Before Python 3.11, instance dictionaries only share keys while the same keys are
+    added in the same order, and none are removed.
+    So, the first time a value is cached, the keys of all shared key properties of the
+    class are added, in order of definition, and clearing the cache leaves the key.
+    """
+
+    cache_name: str = field(init=False, repr=False)
+
+    def bind(self, owner: type, name: str) -> None:
+        super().bind(owner, name)
+
+        self.cache_name = f"__{name}_cache"
+
+        cache_names = owner.__dict__.get(_SHARED_CACHE_NAMES)
+
+        if cache_names is None:
+            cache_names = list(resolve(owner, _SHARED_CACHE_NAMES) or ())
+            setattr(owner, _SHARED_CACHE_NAMES, cache_names)
+
+        cache_names.append(self.cache_name)
+
+    def load(self, instance: Any) -> Any:
+        return instance.__dict__.get(self.cache_name, _unset)
+
+    def save(self, instance: Any, value: Any) -> None:
+        cache = instance.__dict__
+
+        if self.cache_name not in cache:
+            for cache_name in getattr(type(instance), _SHARED_CACHE_NAMES):
+                cache.setdefault(cache_name, _unset)
+
+        cache[self.cache_name] = value
+
+    def discard(self, instance: Any) -> None:
+        cache = instance.__dict__
+
+        if self.cache_name in cache:
+            cache[self.cache_name] = _unset
+
+
+class KeyRef(ref):
+    __slots__ = ("key",)
+
+    key: int
+
+
+@dataclass
+class ExternalStorage(CacheStorage):
+    """Stores values in a table of the property, keyed by the identity of each instance
+
+    For instances without a `__dict__`, such as named tuples and slotted classes.
+    Values are dropped once their instances are garbage collected.
+    Instances that can't be weakly referenced are held strongly instead,
+    for only the `fallback_size` most recently cached.
+    """
+
+    fallback_size: Optional[int] = 1024
+    entries: "Dict[int, Tuple[KeyRef, Any]]" = field(
+        default_factory=dict, init=False, repr=False
+    )
+    fallback: "LRUCache[int, Tuple[Any, Any]]" = field(init=False, repr=False)
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.fallback = LRUCache(self.fallback_size)
+
+        # Bound once, rather than held by each entry
+        self.collected = self._collected
+
+    def load(self, instance: Any) -> Any:
+        key = id(instance)
+        entry = self.entries.get(key)
+
+        # Identities are reused, so check the entry is for this instance
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+
+        entry = self.fallback.get(key)
+
+        if entry is not None and entry[0] is instance:
+            return entry[1]
+
+        return Uncached()
+
+    def save(self, instance: Any, value: Any) -> None:
+        key = id(instance)
+
+        try:
+            key_ref = KeyRef(instance, self.collected)
+        except TypeError:
+            self.fallback[key] = (instance, value)
+            return
+
+        key_ref.key = key
+
+        with self.lock:
+            self.entries[key] = (key_ref, value)
+
+    def discard(self, instance: Any) -> None:
+        key = id(instance)
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and entry[0]() is instance:
+                del self.entries[key]
+
+        entry = self.fallback.get(key)
+
+        if entry is not None and entry[0] is instance:
+            self.fallback.pop(key)
+
+    def __len__(self) -> int:
+        return len(self.entries) + len(self.fallback)
+
+    def _collected(self, key_ref: KeyRef) -> None:
+        with self.lock:
+            entry = self.entries.get(key_ref.key)
+
+            # The identity may have been reused by an instance saved since
+            if entry is not None and entry[0] is key_ref:
+                del self.entries[key_ref.key]
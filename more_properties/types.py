@@ -1,6 +1,6 @@
 from typing import Callable, Generic, Optional, Type, TypeVar
 
-__all__ = ["Getable", "Getter", "Setter", "Deleter"]
+__all__ = ["Getable", "Getter", "Setter", "Deleter", "Uncached"]
 
 OT = TypeVar("OT", contravariant=True)  # Owner Type
 VT_co = TypeVar("VT_co", covariant=True)  # Covariant Value Type
@@ -20,3 +20,7 @@ class Getable(Protocol[OT, VT_co]):
 Getter = Getable[OT, Callable[[], VT_co]]
 Setter = Getable[OT, Callable[[VT_contra], None]]
 Deleter = Getable[OT, Callable[[], None]]
+
+
+class Uncached:
+    pass
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Optional, Type, TypeVar
+
+from more_properties.cached_property import CachedClassProperty
+
+__all__ = [
+    "VersionedType",
+    "versioned_cached_class_property",
+]
+
+OT = TypeVar("OT", contravariant=True)  # Owner Type
+VT = TypeVar("VT")  # Value Type
+
+_VERSION = "__class_version__"
+
+_versions = count(1)
+
+
+def bump_version(cls: type) -> None:
+    """Mark the attributes of `cls`, and so those of its subclasses, as changed"""
+    version = next(_versions)
+    classes = [cls]
+
+    while classes:
+        cls = classes.pop()
+
+        type.__setattr__(cls, _VERSION, version)
+        classes.extend(type.__subclasses__(cls))
+
+
+def class_version(cls: type) -> int:
+    return cls.__dict__.get(_VERSION, 0)  # type: ignore
+
+
+class VersionedType(type):
+    """Metaclass counting changes to the attributes of its classes
+
+    Names starting with a double underscore, as used for caches, aren't counted.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if not name.startswith("__"):
+            bump_version(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+
+        if not name.startswith("__"):
+            bump_version(cls)
+
+
+@dataclass
+class VersionedCachedClassProperty(CachedClassProperty[OT, VT]):
+    def __set_name__(self, owner: Type[OT], name: str) -> None:
+        if not isinstance(owner, VersionedType):
+            raise TypeError(
+                f"Class {owner.__name__} must have metaclass VersionedType"
+                f" to use {type(self).__name__}"
+            )
+
+        super().__set_name__(owner, name)
+
+    @property
+    def version_name(self) -> str:
+        if self.name is None:
+            raise AttributeError(f"Property {self!r} not assigned to class")
+
+        return f"__{self.name}_version"
+
+    def __get__(self, instance: Optional[OT], owner: Type[OT]) -> VT:
+        version = class_version(owner)
+
+        if owner.__dict__.get(self.version_name) != version:
+            self.clear_cache.__get__(owner, owner)()  # type: ignore
+
+            # Recorded before computing, so changes while computing aren't missed
+            setattr(owner, self.version_name, version)
+
+        return super().__get__(instance, owner)
+
+    def precompute(self, owner: Type[OT]) -> None:  # type: ignore
+        setattr(owner, self.version_name, class_version(owner))
+
+        super().precompute(owner)
+
+
+versioned_cached_class_property = VersionedCachedClassProperty
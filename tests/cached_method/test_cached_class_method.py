@@ -0,0 +1,50 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import cached_class_method
+
+
+class TestCachedClassMethod(TestCase):
+    cached_class_method = cached_class_method
+
+    def test_cached_class_method_basic(self):
+        m = Mock()
+
+        class Foo:
+            name = "Foo"
+
+            @self.cached_class_method
+            def identifier(cls, suffix):
+                m(cls, suffix)
+                return cls.name.lower() + suffix
+
+            identifier_clear_cache = identifier.clear_cache
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual("foo1", Foo.identifier("1"))
+                self.assertEqual("foo1", Foo().identifier("1"))
+
+            m.assert_called_once_with(Foo, "1")
+
+        with self.subTest("Cache is per class"):
+            m.reset_mock()
+
+            class Bar(Foo):
+                name = "Bar"
+
+            for _ in range(3):
+                self.assertEqual("foo1", Foo.identifier("1"))
+                self.assertEqual("bar1", Bar.identifier("1"))
+
+            m.assert_called_once_with(Bar, "1")
+
+        with self.subTest("Cache cleared explicitly"):
+            m.reset_mock()
+
+            Foo.identifier_clear_cache()
+
+            for _ in range(3):
+                self.assertEqual("foo1", Foo.identifier("1"))
+
+            m.assert_called_once_with(Foo, "1")
@@ -0,0 +1,134 @@
+import gc
+from dataclasses import dataclass
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+from weakref import ref
+
+from more_properties import cached_method
+
+
+class TestCachedMethod(TestCase):
+    cached_method = cached_method
+
+    def test_cached_method_basic(self):
+        m = Mock()
+
+        @dataclass
+        class Index:
+            i: int
+
+            @self.cached_method
+            def offset(self, by, scale=1):
+                """Offset index"""
+                m(self, by, scale)
+                return (self.i + by) * scale
+
+        index = Index(0)
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual(1, index.offset(1))
+
+            m.assert_called_once_with(index, 1, 1)
+
+        with self.subTest("Value cached per arguments"):
+            m.reset_mock()
+
+            for _ in range(3):
+                self.assertEqual(1, index.offset(1))
+                self.assertEqual(2, index.offset(2))
+                self.assertEqual(4, index.offset(2, scale=2))
+                self.assertEqual(1.5, index.offset(1.5))
+
+            self.assertEqual(3, m.call_count)
+
+        with self.subTest("Cache is per object"):
+            m.reset_mock()
+
+            another_index = Index(10)
+
+            for _ in range(3):
+                self.assertEqual(1, index.offset(1))
+                self.assertEqual(11, another_index.offset(1))
+
+            m.assert_called_once_with(another_index, 1, 1)
+
+        with self.subTest("Docstring"):
+            self.assertEqual("Offset index", Index.__dict__["offset"].__doc__)
+
+    def test_cached_method_class_access(self):
+        m = Mock()
+
+        class Foo:
+            def __init__(self, x):
+                self.x = x
+
+            @self.cached_method
+            def offset(self, by):
+                m(self, by)
+                return self.x + by
+
+        foo = Foo(1)
+
+        for _ in range(3):
+            self.assertEqual(3, Foo.offset(foo, 2))
+            self.assertEqual(3, foo.offset(2))
+
+        m.assert_called_once_with(foo, 2)
+
+    def test_cached_method_maxsize(self):
+        m = Mock()
+
+        @dataclass
+        class Index:
+            i: int
+
+            @partial(self.cached_method, maxsize=2)
+            def offset(self, by):
+                m(by)
+                return self.i + by
+
+        index = Index(0)
+
+        for by in [1, 2, 1, 3, 2]:
+            self.assertEqual(by, index.offset(by))
+
+        self.assertEqual(4, m.call_count)
+
+    def test_cached_method_clear_cache(self):
+        m = Mock()
+
+        @dataclass
+        class Index:
+            i: int
+
+            @self.cached_method
+            def offset(self, by):
+                m(by)
+                return self.i + by
+
+            offset_clear_cache = offset.clear_cache
+
+        index = Index(0)
+
+        index.offset(1)
+        index.offset_clear_cache()
+        index.offset(1)
+
+        self.assertEqual(2, m.call_count)
+
+    def test_cached_method_no_leak(self):
+        class Foo:
+            @self.cached_method
+            def bar(self, x):
+                return x
+
+        foo = Foo()
+        foo.bar(1)
+
+        foo_ref = ref(foo)
+        del foo
+        gc.collect()
+
+        self.assertIsNone(foo_ref())
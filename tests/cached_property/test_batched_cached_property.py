@@ -0,0 +1,185 @@
+import asyncio
+import subprocess
+import sys
+from functools import partial
+from unittest import TestCase, skipIf
+from unittest.mock import Mock
+
+from more_properties import batched_cached_property
+
+
+class TestBatchedCachedProperty(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def make_class(self, m, **kwargs):
+        async def load_owners(ids):
+            m(ids)
+            return [f"User {id}" for id in ids]
+
+        class Post:
+            def __init__(self, owner_id):
+                self.owner_id = owner_id
+
+            @partial(batched_cached_property, load_batch=load_owners, **kwargs)
+            def owner(self):
+                return self.owner_id
+
+            owner_clear_cache = owner.clear_cache
+
+        return Post
+
+    def test_batched_cached_property_basic(self):
+        m = Mock()
+        Post = self.make_class(m)
+        posts = [Post(i % 3) for i in range(6)]
+
+        async def load_all():
+            return await asyncio.gather(*(post.owner for post in posts))
+
+        with self.subTest("Loaded in one batch"):
+            owners = self.run_async(load_all())
+
+            self.assertEqual([f"User {i % 3}" for i in range(6)], owners)
+            m.assert_called_once_with([0, 1, 2])
+
+        with self.subTest("Value cached"):
+            m.reset_mock()
+
+            self.assertEqual(owners, self.run_async(load_all()))
+            m.assert_not_called()
+
+        with self.subTest("Cache cleared explicitly"):
+            posts[0].owner_clear_cache()
+
+            self.assertEqual(owners, self.run_async(load_all()))
+            m.assert_called_once_with([0])
+
+    def test_batched_cached_property_max_batch_size(self):
+        m = Mock()
+        Post = self.make_class(m, max_batch_size=2)
+        posts = [Post(i) for i in range(5)]
+
+        async def load_all():
+            return await asyncio.gather(*(post.owner for post in posts))
+
+        self.assertEqual([f"User {i}" for i in range(5)], self.run_async(load_all()))
+        self.assertEqual(
+            [[0, 1], [2, 3], [4]], [args[0] for args, _ in m.call_args_list]
+        )
+
+    def test_batched_cached_property_separate_ticks(self):
+        m = Mock()
+        Post = self.make_class(m)
+
+        async def load_each():
+            return [await Post(i).owner for i in range(2)]
+
+        self.assertEqual(["User 0", "User 1"], self.run_async(load_each()))
+        self.assertEqual(2, m.call_count)
+
+    def test_batched_cached_property_failure(self):
+        m = Mock(side_effect=[Exception("Failed"), None])
+        Post = self.make_class(m)
+        post = Post(1)
+
+        async def load():
+            return await post.owner
+
+        with self.subTest("Exception raised"):
+            with self.assertRaisesRegex(Exception, "Failed"):
+                self.run_async(load())
+
+        with self.subTest("Retried on next access"):
+            self.assertEqual("User 1", self.run_async(load()))
+
+    def test_batched_cached_property_cancelled_access(self):
+        m = Mock()
+        Post = self.make_class(m)
+        posts = [Post(1), Post(1)]
+
+        async def load():
+            cancelled, first, second = posts[0].owner, posts[0].owner, posts[1].owner
+            cancelled.cancel()
+
+            return await first, await second
+
+        self.assertEqual(("User 1", "User 1"), self.run_async(load()))
+        m.assert_called_once_with([1])
+
+    def test_batched_cached_property_cancelled_batch(self):
+        blocker = self.loop.create_future()
+
+        async def load_owners(ids):
+            if not blocker.done():
+                await blocker
+
+            return [f"User {id}" for id in ids]
+
+        class Post:
+            @partial(batched_cached_property, load_batch=load_owners)
+            def owner(self):
+                return 1
+
+        post = Post()
+
+        async def load():
+            future = post.owner
+
+            # Until the batch is waiting on the blocker
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+            blocker.cancel()
+
+            return await future
+
+        with self.subTest("Cancelled"):
+            with self.assertRaises(asyncio.CancelledError):
+                self.run_async(load())
+
+        with self.subTest("Retried on next access"):
+            self.assertEqual("User 1", self.run_async(load()))
+
+    @skipIf(sys.version_info < (3, 7), "Running loops are found since Python 3.7")
+    def test_batched_cached_property_no_running_loop(self):
+        Post = self.make_class(Mock())
+
+        with self.assertRaisesRegex(RuntimeError, "no running event loop"):
+            Post(1).owner
+
+    @skipIf(sys.version_info < (3, 7), "Module __getattr__ is new in Python 3.7")
+    def test_batched_cached_property_lazy_import(self):
+        code = "import sys, more_properties; print('asyncio' in sys.modules)"
+
+        output = subprocess.check_output([sys.executable, "-c", code])
+
+        self.assertEqual(b"False", output.strip())
+
+    def test_batched_cached_property_wrong_length(self):
+        async def load_nothing(ids):
+            return []
+
+        class Post:
+            @partial(batched_cached_property, load_batch=load_nothing)
+            def owner(self):
+                return 1
+
+        async def load():
+            return await Post().owner
+
+        with self.assertRaisesRegex(ValueError, "returned 0 values for 1 keys"):
+            self.run_async(load())
+
+    def test_batched_cached_property_invalid(self):
+        with self.assertRaisesRegex(ValueError, "load_batch"):
+            batched_cached_property(lambda self: 1)
+
+        with self.assertRaisesRegex(ValueError, "can't be eager"):
+            batched_cached_property(lambda self: 1, load_batch=Mock(), eager=True)
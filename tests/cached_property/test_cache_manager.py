@@ -0,0 +1,199 @@
+import time
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import (
+    CacheManager,
+    ExternalStorage,
+    cached_class_property,
+    cached_property,
+    cached_static_property,
+    get_cache_manager,
+    set_cache_manager,
+    thread_local_cached_property,
+)
+
+
+class TestCacheManager(TestCase):
+    def tearDown(self):
+        set_cache_manager(None)
+
+    def test_max_entries(self):
+        m = Mock()
+        manager = CacheManager(max_entries=2)
+        set_cache_manager(manager)
+
+        class Foo:
+            @cached_property
+            def bar(self):
+                m(self)
+                return [self]
+
+        foos = [Foo() for _ in range(3)]
+
+        for foo in foos:
+            foo.bar
+
+        with self.subTest("Active manager"):
+            self.assertIs(manager, get_cache_manager())
+
+        with self.subTest("Value evicted"):
+            cached = [foo for foo in foos if "__bar_cache" in vars(foo)]
+
+            self.assertEqual(2, len(manager.entries))
+            self.assertEqual(1, manager.evictions)
+            self.assertEqual(2, len(cached))
+
+        with self.subTest("Most recent value kept"):
+            self.assertIn(foos[2], cached)
+
+        with self.subTest("Evicted value recomputed"):
+            evicted = next(foo for foo in foos if foo not in cached)
+            evicted.bar
+
+            self.assertEqual(4, m.call_count)
+
+    def test_cost_aware(self):
+        manager = CacheManager(max_entries=2)
+        set_cache_manager(manager)
+
+        class Foo:
+            @cached_property
+            def slow(self):
+                time.sleep(0.01)
+                return 1
+
+            @cached_property
+            def fast(self):
+                return 1
+
+        foo, other = Foo(), Foo()
+        foo.slow
+        foo.fast
+        other.fast
+
+        with self.subTest("Cheapest value evicted"):
+            self.assertIn("__slow_cache", vars(foo))
+            self.assertNotIn("__fast_cache", vars(foo))
+
+    def test_priority(self):
+        manager = CacheManager(max_entries=1)
+        set_cache_manager(manager)
+
+        class Foo:
+            @partial(cached_property, priority=0)
+            def bar(self):
+                return 1
+
+        foo, other = Foo(), Foo()
+        foo.bar
+        other.bar
+
+        with self.subTest("Value evicted"):
+            self.assertNotIn("__bar_cache", vars(foo))
+
+    def test_max_bytes(self):
+        manager = CacheManager(max_bytes=100, sizeof=len)
+        set_cache_manager(manager)
+
+        class Foo:
+            @cached_property
+            def bar(self):
+                return "x" * 60
+
+        foo, other = Foo(), Foo()
+        foo.bar
+        other.bar
+
+        with self.subTest("Over budget value evicted"):
+            self.assertEqual(60, manager.total_bytes)
+            self.assertNotIn("__bar_cache", vars(foo))
+
+    def test_class_and_static(self):
+        manager = CacheManager(max_entries=1)
+        set_cache_manager(manager)
+
+        class Foo:
+            @cached_class_property
+            def bar(cls):
+                return 1
+
+            @cached_static_property
+            def baz():
+                return 2
+
+        Foo.bar
+        Foo.baz
+
+        with self.subTest("Class value evicted"):
+            self.assertNotIn("__bar_cache", vars(Foo))
+
+        with self.subTest("Static value kept"):
+            self.assertEqual(2, vars(Foo)["baz"].value)
+
+    def test_unmanaged(self):
+        manager = CacheManager(max_entries=1)
+        set_cache_manager(manager)
+
+        class Foo:
+            @partial(cached_property, managed=False)
+            def bar(self):
+                return 1
+
+            @thread_local_cached_property
+            def baz(self):
+                return 2
+
+        foo = Foo()
+        foo.bar
+        foo.baz
+
+        with self.subTest("Not tracked"):
+            self.assertEqual(0, len(manager.entries))
+
+    def test_clear_cache(self):
+        manager = CacheManager(max_bytes=1000)
+        set_cache_manager(manager)
+
+        class Foo:
+            @cached_property
+            def bar(self):
+                return 1
+
+        foo = Foo()
+        foo.bar
+
+        with self.subTest("Tracked"):
+            self.assertEqual(1, len(manager.entries))
+
+        with self.subTest("Forgotten when cleared"):
+            Foo.__dict__["bar"].clear_cache(foo)
+            self.assertEqual(0, len(manager.entries))
+            self.assertEqual(0, manager.total_bytes)
+
+        with self.subTest("Forgotten when collected"):
+            foo.bar
+            del foo
+            self.assertEqual(0, len(manager.entries))
+
+        with self.subTest("Manager clear"):
+            foo = Foo()
+            foo.bar
+            manager.clear()
+            self.assertNotIn("__bar_cache", vars(foo))
+
+    def test_not_weakly_referenceable(self):
+        manager = CacheManager(max_entries=1)
+        set_cache_manager(manager)
+
+        class Foo:
+            __slots__ = ()
+
+            @partial(cached_property, storage=ExternalStorage())
+            def bar(self):
+                return 1
+
+        with self.subTest("Not tracked"):
+            self.assertEqual(1, Foo().bar)
+            self.assertEqual(0, len(manager.entries))
@@ -1,4 +1,5 @@
 from functools import partial
+from threading import Event
 from unittest.mock import Mock
 
 from more_properties import cached_class_property
@@ -80,5 +81,75 @@ class TestCachedClassProperty(TestClassProperty):
 
             m.assert_called_once_with(Foo)
 
+    def test_cached_class_property_eager(self):
+        m = Mock()
+        computed = Event()
+
+        class Foo:
+            name = "Foo"
+
+            @partial(self.class_property, eager=True)
+            def identifier(cls):
+                """Object identifier"""
+                m(cls)
+                computed.set()
+                return cls.name.lower()
+
+        with self.subTest("Computed on class creation"):
+            self.assertTrue(computed.wait(1))
+            m.assert_called_once_with(Foo)
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual("foo", Foo.identifier)
+                self.assertEqual("foo", Foo().identifier)
+
+            m.assert_called_once_with(Foo)
+
+        with self.subTest("Computed on subclass creation"):
+            m.reset_mock()
+            computed.clear()
+
+            class Bar(Foo):
+                name = "Bar"
+
+            self.assertTrue(computed.wait(1))
+            m.assert_called_once_with(Bar)
+
+            self.assertEqual("bar", Bar.identifier)
+            m.assert_called_once_with(Bar)
+
+    def test_cached_class_property_eager_exception(self):
+        class Foo:
+            @partial(self.class_property, eager=True)
+            def identifier(cls):
+                raise ValueError("Bad value")
+
+        with self.assertRaisesRegex(ValueError, "Bad value"):
+            Foo.identifier
+
+    def test_cached_class_property_write_through(self):
+        m = Mock()
+
+        class Foo:
+            name = "Foo"
+
+            @partial(self.class_property, write_through=True)
+            def identifier(cls):
+                """Object identifier"""
+                m(cls)
+                return cls.name.lower()
+
+            @identifier.setter
+            def identifier(cls, value):
+                cls.name = value.title()
+                return value.lower()
+
+        Foo().identifier = "DooHickey"
+
+        self.assertEqual("Doohickey", Foo.name)
+        self.assertEqual("doohickey", Foo.identifier)
+        m.assert_not_called()
+
 
 del TestClassProperty
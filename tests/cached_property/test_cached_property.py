@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from inspect import signature
+from threading import Event
 from typing import Optional
 from unittest.mock import Mock
 
-from more_properties import cached_property
+from more_properties import InternTable, cached_property
 from tests.test_property import TestProperty
 
 
@@ -84,5 +87,334 @@ class TestCachedProperty(TestProperty):
 
             m.assert_called_once_with(index)
 
+    def test_cached_property_eager(self):
+        m = Mock()
+        computed = Event()
+
+        @dataclass
+        class Index:
+            i: Optional[int] = None
+
+            @partial(self.property, eager=True)
+            def i1(self):
+                """1 based index"""
+                m(self)
+                computed.set()
+                return self.i + 1 if self.i is not None else None
+
+        class SubIndex(Index):
+            pass
+
+        for cls in [Index, SubIndex]:
+            with self.subTest("Computed on construction", cls=cls):
+                m.reset_mock()
+                computed.clear()
+
+                index = cls(0)
+
+                self.assertTrue(computed.wait(1))
+                m.assert_called_once_with(index)
+
+            with self.subTest("Value cached", cls=cls):
+                for _ in range(3):
+                    self.assertEqual(1, index.i1)
+
+                m.assert_called_once_with(index)
+
+    def test_cached_property_eager_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+
+            class Foo:
+                def __init__(self, x):
+                    self.x = x
+
+                @partial(self.property, eager=True, executor=executor)
+                def y(self):
+                    return self.x + 1
+
+            self.assertEqual(2, Foo(1).y)
+
+    def test_cached_property_eager_init(self):
+        class Foo:
+            def __init__(self, x: int, y: int = 0) -> None:
+                """Make a Foo"""
+                self.x = x + y
+
+            @partial(self.property, eager=True)
+            def z(self):
+                return self.x + 1
+
+        self.assertEqual(2, Foo(1).z)
+        self.assertEqual(
+            "(self, x: int, y: int = 0) -> None", str(signature(Foo.__init__))
+        )
+        self.assertEqual("Make a Foo", Foo.__init__.__doc__)
+
+    def test_cached_property_eager_new(self):
+        class Double(int):
+            @partial(self.property, eager=True)
+            def double(self):
+                return self * 2
+
+        class Foo:
+            def __new__(cls, x):
+                foo = super().__new__(cls)
+                foo.x = x
+                return foo
+
+            @partial(self.property, eager=True)
+            def y(self):
+                return self.x + 1
+
+        self.assertEqual(6, Double(3).double)
+        self.assertEqual(2, Foo(1).y)
+
+    def test_cached_property_eager_exception(self):
+        m = Mock(side_effect=ValueError("Bad value"))
+
+        @dataclass
+        class Index:
+            i: Optional[int] = None
+
+            @partial(self.property, eager=True)
+            def i1(self):
+                """1 based index"""
+                return m(self)
+
+        index = Index(0)
+
+        with self.subTest("Raised on access"):
+            with self.assertRaisesRegex(ValueError, "Bad value"):
+                index.i1
+
+        with self.subTest("Recomputed on next access"):
+            m.side_effect = None
+            m.return_value = 1
+
+            self.assertEqual(1, index.i1)
+            self.assertEqual(2, m.call_count)
+
+    def test_cached_property_weak(self):
+        class Document:
+            pass
+
+        m = Mock(side_effect=Document)
+
+        class Foo:
+            @partial(self.property, weak=True)
+            def document(self):
+                return m()
+
+            @partial(self.property, weak=True)
+            def name(self):
+                m()
+                return "Not weakly referenceable"
+
+        foo = Foo()
+        stats = Foo.__dict__["document"].stats
+
+        with self.subTest("Value cached while referenced"):
+            document = foo.document
+
+            self.assertIs(document, foo.document)
+            m.assert_called_once_with()
+
+        with self.subTest("Value recomputed once collected"):
+            m.reset_mock()
+            del document
+
+            foo.document
+            m.assert_called_once_with()
+
+            self.assertEqual(1, stats.collected)
+            self.assertEqual(2, stats.misses)
+
+        with self.subTest("Value held strongly if not weakly referenceable"):
+            m.reset_mock()
+
+            for _ in range(3):
+                self.assertEqual("Not weakly referenceable", foo.name)
+
+            m.assert_called_once_with()
+
+    def test_cached_property_weak_keep_alive(self):
+        class Document:
+            pass
+
+        m = Mock(side_effect=Document)
+
+        class Foo:
+            @partial(self.property, weak=True, keep_alive=1)
+            def document(self):
+                return m()
+
+        foo, bar = Foo(), Foo()
+
+        with self.subTest("Recent value kept alive"):
+            foo.document
+            foo.document
+
+            m.assert_called_once_with()
+
+        with self.subTest("Older value collected"):
+            m.reset_mock()
+
+            bar.document
+            foo.document
+
+            self.assertEqual(2, m.call_count)
+            self.assertEqual(1, Foo.__dict__["document"].stats.collected)
+
+    def test_cached_property_intern(self):
+        table = InternTable()
+
+        @dataclass
+        class Product:
+            tags: str
+
+            @partial(self.property, intern=True)
+            def tag_set(self):
+                return frozenset(self.tags.split())
+
+            @partial(self.property, intern=table)
+            def upper_tags(self):
+                return self.tags.upper()
+
+        @dataclass
+        class Category:
+            tags: str
+
+            @partial(self.property, intern=table)
+            def upper_tags(self):
+                return self.tags.upper()
+
+        foo, bar, baz = Product("a b"), Product("b a"), Product("c")
+
+        with self.subTest("Equal values shared"):
+            self.assertIs(foo.tag_set, bar.tag_set)
+            self.assertIsNot(foo.tag_set, baz.tag_set)
+            self.assertEqual(frozenset({"c"}), baz.tag_set)
+
+        with self.subTest("Table shared across properties"):
+            self.assertIs(Product("a b").upper_tags, Category("a b").upper_tags)
+
+        with self.subTest("Stats"):
+            intern_table = Product.__dict__["tag_set"].intern_table
+
+            self.assertEqual(1 / 3, intern_table.dedup_ratio)
+            self.assertEqual(1 / 2, table.dedup_ratio)
+
+    def test_cached_property_key(self):
+        m = Mock()
+
+        @dataclass
+        class Product:
+            sku: str
+            version: int
+
+            @partial(self.property, key=lambda self: (self.sku, self.version))
+            def description(self):
+                m(self)
+                return f"{self.sku} v{self.version}"
+
+            invalidate_description = description.invalidate
+
+        key_cache = Product.__dict__["description"].key_cache
+
+        with self.subTest("Value shared between equal keys"):
+            for _ in range(3):
+                self.assertEqual("foo v1", Product("foo", 1).description)
+
+            m.assert_called_once_with(Product("foo", 1))
+
+        with self.subTest("Value not shared between different keys"):
+            m.reset_mock()
+
+            self.assertEqual("foo v2", Product("foo", 2).description)
+            m.assert_called_once_with(Product("foo", 2))
+
+        with self.subTest("Value cached per object"):
+            m.reset_mock()
+
+            product = Product("bar", 1)
+            hits = key_cache.hits
+
+            for _ in range(3):
+                self.assertEqual("bar v1", product.description)
+
+            m.assert_called_once_with(product)
+            self.assertEqual(hits, key_cache.hits)
+
+        with self.subTest("Stats"):
+            self.assertEqual(2, key_cache.hits)
+            self.assertEqual(3, key_cache.misses)
+            self.assertEqual(2 / 5, key_cache.hit_rate)
+
+        with self.subTest("Invalidate by key"):
+            m.reset_mock()
+
+            Product.invalidate_description(("foo", 1))
+
+            self.assertEqual("foo v1", Product("foo", 1).description)
+            m.assert_called_once_with(Product("foo", 1))
+
+    def test_cached_property_key_bounded(self):
+        m = Mock()
+
+        @dataclass
+        class Foo:
+            x: int
+
+            @partial(self.property, key=lambda self: self.x, key_cache_size=1)
+            def y(self):
+                m(self)
+                return self.x + 1
+
+        for x in [1, 2, 1]:
+            self.assertEqual(x + 1, Foo(x).y)
+
+        self.assertEqual(3, m.call_count)
+
+    def test_cached_property_write_through(self):
+        m = Mock()
+
+        @dataclass
+        class Index:
+            i: Optional[int] = None
+
+            @partial(self.property, write_through=True)
+            def i1(self):
+                """1 based index"""
+                m(self)
+                return self.i + 1 if self.i is not None else None
+
+            @i1.setter
+            def i1(self, value):
+                self.i = value - 1
+
+            @partial(self.property, write_through=True)
+            def name(self):
+                m(self)
+                return "default"
+
+            @name.setter
+            def name(self, value):
+                return value.lower()
+
+        index = Index(0)
+
+        with self.subTest("Assigned value cached"):
+            index.i1 = 10
+
+            self.assertEqual(9, index.i)
+            self.assertEqual(10, index.i1)
+            m.assert_not_called()
+
+        with self.subTest("Value returned by setter cached"):
+            index.name = "Foo"
+
+            self.assertEqual("foo", index.name)
+            m.assert_not_called()
+
 
 del TestProperty
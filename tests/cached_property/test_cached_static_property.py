@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 from functools import partial
+from threading import Event
 
 from more_properties import cached_static_property
 from tests.class_property.test_static_property import TestStaticProperty
@@ -80,5 +81,48 @@ class TestCachedStaticProperty(TestStaticProperty):
 
             m.assert_called_once_with()
 
+    def test_cached_static_property_eager(self):
+        m = Mock()
+        computed = Event()
+
+        class Foo:
+            @partial(self.static_property, eager=True)
+            def var():
+                """Object identifier"""
+                m()
+                computed.set()
+                return "Value"
+
+        with self.subTest("Computed on class creation"):
+            self.assertTrue(computed.wait(1))
+            m.assert_called_once_with()
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual("Value", Foo.var)
+                self.assertEqual("Value", Foo().var)
+
+            m.assert_called_once_with()
+
+    def test_cached_static_property_write_through(self):
+        m = Mock()
+
+        class Foo:
+            var_cache = "Value"
+
+            @partial(self.static_property, write_through=True)
+            def var():
+                m()
+                return Foo.var_cache
+
+            @var.setter
+            def var(value):
+                Foo.var_cache = value
+
+        Foo().var = "New value"
+
+        self.assertEqual("New value", Foo.var)
+        m.assert_not_called()
+
 
 del TestStaticProperty
@@ -0,0 +1,188 @@
+import copy
+from concurrent.futures import Future
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import (
+    ColumnarStorage,
+    bump_epoch,
+    cached_class_property,
+    cached_property,
+    cached_static_property,
+    exclude_caches,
+    thread_local_cached_property,
+)
+
+
+class ImmediateExecutor:
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class TestEpochs(TestCase):
+    def test_epochs_basic(self):
+        m = Mock(return_value="Value")
+
+        class Foo:
+            @partial(cached_property, epoch="basic")
+            def a(self):
+                return m("a")
+
+            @partial(cached_class_property, epoch="basic")
+            def b(cls):
+                return m("b")
+
+            @partial(cached_static_property, epoch="basic")
+            def c():
+                return m("c")
+
+            @partial(cached_property, epoch="other")
+            def d(self):
+                return m("d")
+
+        foos = [Foo(), Foo()]
+
+        def access():
+            for foo in foos:
+                foo.a
+                foo.b
+                foo.c
+                foo.d
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                access()
+
+            self.assertEqual(6, m.call_count)
+
+        with self.subTest("Values invalidated by bump"):
+            m.reset_mock()
+            bump_epoch("basic")
+
+            for _ in range(3):
+                access()
+
+            self.assertEqual(4, m.call_count)
+            self.assertNotIn("d", [args[0] for args, _ in m.call_args_list])
+
+    def test_epochs_write_through(self):
+        class Foo:
+            @partial(cached_property, epoch="write_through", write_through=True)
+            def bar(self):
+                return "Computed"
+
+            @bar.setter
+            def bar(self, value):
+                pass
+
+        foo = Foo()
+        foo.bar = "Written"
+
+        with self.subTest("Written value cached"):
+            self.assertEqual("Written", foo.bar)
+
+        with self.subTest("Written value invalidated by bump"):
+            bump_epoch("write_through")
+            self.assertEqual("Computed", foo.bar)
+
+    def test_epochs_weak(self):
+        class Document:
+            pass
+
+        class Foo:
+            @partial(cached_property, epoch="weak", weak=True)
+            def document(self):
+                return Document()
+
+        foo = Foo()
+        document = foo.document
+
+        with self.subTest("Value cached"):
+            self.assertIs(document, foo.document)
+
+        with self.subTest("Value invalidated by bump"):
+            bump_epoch("weak")
+            self.assertIsNot(document, foo.document)
+
+    def test_epochs_key(self):
+        m = Mock(side_effect=lambda x: x)
+
+        class Foo:
+            def __init__(self, x):
+                self.x = x
+
+            @partial(cached_property, epoch="key", key=lambda self: self.x)
+            def bar(self):
+                return m(self.x)
+
+        Foo(1).bar
+
+        with self.subTest("Shared value cached"):
+            Foo(1).bar
+            self.assertEqual(1, m.call_count)
+
+        with self.subTest("Shared value invalidated by bump"):
+            bump_epoch("key")
+            Foo(1).bar
+            self.assertEqual(2, m.call_count)
+
+    def test_epochs_eager(self):
+        m = Mock(return_value="Value")
+
+        class Foo:
+            @partial(
+                cached_property, epoch="eager", eager=True, executor=ImmediateExecutor()
+            )
+            def bar(self):
+                return m()
+
+        foo = Foo()
+
+        with self.subTest("Eager value used"):
+            self.assertEqual("Value", foo.bar)
+            m.assert_called_once_with()
+
+        with self.subTest("Stale eager value discarded"):
+            m.reset_mock()
+            foo = Foo()
+            bump_epoch("eager")
+
+            self.assertEqual("Value", foo.bar)
+            self.assertEqual(2, m.call_count)
+
+    def test_epochs_thread_local(self):
+        m = Mock(return_value="Value")
+
+        class Foo:
+            @partial(thread_local_cached_property, epoch="thread_local")
+            def bar(self):
+                return m()
+
+        foo = Foo()
+        foo.bar
+        foo.bar
+        bump_epoch("thread_local")
+        foo.bar
+
+        self.assertEqual(2, m.call_count)
+
+    def test_epochs_pickling(self):
+        @exclude_caches
+        class Foo:
+            @partial(cached_property, epoch="pickling", persist=True)
+            def bar(self):
+                return "Value"
+
+        foo = Foo()
+        foo.bar
+
+        self.assertNotIn("__bar_cache", vars(copy.copy(foo)))
+
+    def test_epochs_columnar(self):
+        with self.assertRaisesRegex(ValueError, "Columnar storage"):
+            cached_property(
+                lambda self: 1, epoch="columnar", storage=ColumnarStorage("d")
+            )
@@ -0,0 +1,129 @@
+import gc
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import (
+    cached_class_property,
+    cached_static_property,
+    class_property,
+    freeze,
+    freeze_all,
+    unfreeze,
+    unfreeze_all,
+)
+from tests.module_property.test_module_property import make_module
+
+
+class TestFreeze(TestCase):
+    def tearDown(self):
+        unfreeze_all()
+
+    def test_freeze_basic(self):
+        m = Mock()
+
+        class Foo:
+            name = "Foo"
+
+            @cached_class_property
+            def identifier(cls):
+                m(cls)
+                return cls.name.lower()
+
+            @cached_static_property
+            def var():
+                m()
+                return "Value"
+
+            @class_property
+            def uncached(cls):
+                return cls.name
+
+        class Bar(Foo):
+            name = "Bar"
+
+        freeze(Foo)
+
+        with self.subTest("Values computed"):
+            self.assertEqual(3, m.call_count)
+
+        with self.subTest("Properties replaced"):
+            self.assertEqual("foo", Foo.__dict__["identifier"])
+            self.assertEqual("bar", Bar.__dict__["identifier"])
+            self.assertEqual("Value", Foo.__dict__["var"])
+            self.assertNotIn("var", Bar.__dict__)
+
+        with self.subTest("Values unchanged"):
+            self.assertEqual("foo", Foo().identifier)
+            self.assertEqual("bar", Bar().identifier)
+            self.assertEqual("Value", Bar.var)
+
+        with self.subTest("Uncached properties unaffected"):
+            self.assertIsInstance(Foo.__dict__["uncached"], class_property)
+
+        with self.subTest("Subclasses defined later"):
+            m.reset_mock()
+
+            class Baz(Bar):
+                name = "Baz"
+
+            self.assertEqual("baz", Baz.__dict__["identifier"])
+            m.assert_called_once_with(Baz)
+
+        with self.subTest("Unfreeze"):
+            unfreeze(Bar)
+
+            for cls in [Bar, Baz]:
+                self.assertNotIn("identifier", cls.__dict__)
+
+            self.assertIsInstance(Foo.__dict__["identifier"], cached_class_property)
+            self.assertIsInstance(Foo.__dict__["var"], cached_static_property)
+
+            m.reset_mock()
+
+            self.assertEqual("baz", Baz.identifier)
+            self.assertEqual("Value", Baz.var)
+            m.assert_not_called()
+
+    def test_freeze_all(self):
+        class Foo:
+            @cached_class_property
+            def identifier(cls):
+                return cls.__name__.lower()
+
+        class Bar:
+            @cached_static_property
+            def var():
+                return "Value"
+
+        # Drop classes of other tests
+        gc.collect()
+
+        freeze_all()
+
+        self.assertEqual("foo", Foo.__dict__["identifier"])
+        self.assertEqual("Value", Bar.__dict__["var"])
+
+    def test_freeze_module(self):
+        module = make_module(
+            "lazy_module",
+            """
+            from more_properties import cached_module_property
+
+            @cached_module_property
+            def var():
+                return "Value"
+
+            def get_var():
+                return var
+            """,
+        )
+
+        freeze(type(module))
+
+        self.assertEqual("Value", module.var)
+        self.assertEqual("Value", module.get_var())
+
+        unfreeze(type(module))
+
+        self.assertEqual("Value", module.var)
+        self.assertIsInstance(module.get_var(), cached_static_property)
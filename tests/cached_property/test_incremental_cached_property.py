@@ -0,0 +1,157 @@
+import copy
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import exclude_caches, incremental_cached_property
+
+
+class TestIncrementalCachedProperty(TestCase):
+    def make_class(self, m):
+        @exclude_caches
+        class Log:
+            def __init__(self):
+                self.entries = []
+
+            def append(self, entry):
+                self.entries.append(entry)
+                Log.total_clear_cache(self)
+
+            def clear(self):
+                self.entries.clear()
+                Log.total_clear_cache(self)
+
+            @incremental_cached_property
+            def total(self):
+                m("compute")
+                return sum(self.entries)
+
+            @total.cursor
+            def total(self):
+                return len(self.entries)
+
+            @total.updater
+            def total(self, previous, cursor):
+                if cursor > len(self.entries):
+                    return NotImplemented
+
+                m("update", cursor)
+                return previous + sum(self.entries[cursor:])
+
+            total_clear_cache = total.clear_cache
+
+        return Log
+
+    def test_incremental_cached_property_basic(self):
+        m = Mock()
+        log = self.make_class(m)()
+        log.append(1)
+        log.append(2)
+
+        with self.subTest("Value computed"):
+            for _ in range(3):
+                self.assertEqual(3, log.total)
+
+            m.assert_called_once_with("compute")
+
+        with self.subTest("Value updated from previous value"):
+            m.reset_mock()
+            log.append(3)
+            log.append(4)
+
+            for _ in range(3):
+                self.assertEqual(10, log.total)
+
+            m.assert_called_once_with("update", 2)
+
+        with self.subTest("Value recomputed when update not possible"):
+            m.reset_mock()
+            log.clear()
+            log.append(5)
+            log.entries.insert(0, 6)
+
+            self.assertEqual(11, log.total)
+            self.assertEqual(1, m.call_count)
+
+        with self.subTest("Never accessed"):
+            m.reset_mock()
+            other = type(log)()
+            other.append(1)
+
+            self.assertEqual(1, other.total)
+            m.assert_called_once_with("compute")
+
+    def test_incremental_cached_property_write_through(self):
+        class Counter:
+            def __init__(self):
+                self.events = []
+
+            @partial(incremental_cached_property, write_through=True)
+            def count(self):
+                return len(self.events)
+
+            @count.cursor
+            def count(self):
+                return len(self.events)
+
+            @count.updater
+            def count(self, previous, cursor):
+                return previous + len(self.events) - cursor
+
+            @count.setter
+            def count(self, value):
+                pass
+
+            count_clear_cache = count.clear_cache
+
+        counter = Counter()
+        counter.events.append("a")
+        counter.count = 10
+        counter.events.append("b")
+        counter.count_clear_cache()
+
+        self.assertEqual(11, counter.count)
+
+    def test_incremental_cached_property_pickling(self):
+        log = self.make_class(Mock())()
+        log.append(1)
+        log.total
+        log.append(2)
+
+        self.assertEqual({"entries": [1, 2]}, vars(copy.copy(log)))
+
+    def test_incremental_cached_property_intern(self):
+        class Tags:
+            def __init__(self):
+                self.tags = []
+
+            @partial(incremental_cached_property, intern=True)
+            def unique(self):
+                return tuple(sorted(set(self.tags)))
+
+            @unique.cursor
+            def unique(self):
+                return len(self.tags)
+
+            @unique.updater
+            def unique(self, previous, cursor):
+                return tuple(sorted(set(previous).union(self.tags[cursor:])))
+
+            unique_clear_cache = unique.clear_cache
+
+        tags = Tags()
+        tags.tags.extend(["a", "b"])
+        computed = tags.unique
+
+        another_tags = Tags()
+        another_tags.tags.append("a")
+        another_tags.unique
+
+        another_tags.tags.append("b")
+        another_tags.unique_clear_cache()
+
+        self.assertIs(computed, another_tags.unique)
+
+    def test_incremental_cached_property_invalid(self):
+        with self.assertRaisesRegex(ValueError, "can't be eager"):
+            incremental_cached_property(lambda self: 1, eager=True)
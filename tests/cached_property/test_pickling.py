@@ -0,0 +1,144 @@
+import pickle
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import cached_method, cached_property, exclude_caches
+
+m = Mock()
+
+
+@exclude_caches
+@dataclass
+class Foo:
+    x: int
+
+    @cached_property
+    def y(self):
+        m("y")
+        return self.x + 1
+
+    @partial(cached_property, persist=True)
+    def z(self):
+        m("z")
+        return self.x + 2
+
+    @cached_method
+    def w(self, offset):
+        return self.x + offset
+
+
+@exclude_caches
+class Bar:
+    def __init__(self, x):
+        self.x = x
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["x"] += 1
+        return state
+
+    @cached_property
+    def y(self):
+        return self.x + 1
+
+
+class Baz:
+    def __init__(self, x):
+        self.x = x
+
+    @partial(cached_property, eager=True)
+    def y(self):
+        return self.x + 1
+
+
+class Document:
+    def __init__(self, x):
+        self.x = x
+
+
+class Qux:
+    def __init__(self, x):
+        self.x = x
+
+    @partial(cached_property, weak=True)
+    def document(self):
+        m("document")
+        return Document(self.x)
+
+
+class TestPickling(TestCase):
+    def setUp(self):
+        m.reset_mock()
+
+    def test_exclude_caches(self):
+        for name, duplicate in [
+            ("pickle", lambda obj: pickle.loads(pickle.dumps(obj))),
+            ("copy", copy),
+            ("deepcopy", deepcopy),
+        ]:
+            with self.subTest(name):
+                m.reset_mock()
+
+                foo = Foo(1)
+                foo.y, foo.z, foo.w(1)
+
+                foo_copy = duplicate(foo)
+                m.reset_mock()
+
+                self.assertEqual(Foo(1), foo_copy)
+                self.assertNotIn("__y_cache", foo_copy.__dict__)
+                self.assertIn("__z_cache", foo_copy.__dict__)
+                self.assertNotIn("__w_cache", foo_copy.__dict__)
+
+                self.assertEqual(2, foo_copy.y)
+                self.assertEqual(3, foo_copy.z)
+                m.assert_called_once_with("y")
+
+    def test_exclude_caches_original_getstate(self):
+        bar = Bar(1)
+        bar.y
+
+        bar_copy = pickle.loads(pickle.dumps(bar))
+
+        self.assertEqual({"x": 2}, bar_copy.__dict__)
+        self.assertEqual(3, bar_copy.y)
+
+    def test_exclude_caches_original_unaffected(self):
+        foo = Foo(1)
+        foo.y
+
+        copy(foo)
+
+        self.assertIn("__y_cache", foo.__dict__)
+
+    def test_eager_pending(self):
+        for name, duplicate in [
+            ("pickle", lambda obj: pickle.loads(pickle.dumps(obj))),
+            ("copy", copy),
+            ("deepcopy", deepcopy),
+        ]:
+            with self.subTest(name):
+                baz_copy = duplicate(Baz(1))
+
+                self.assertEqual(2, baz_copy.y)
+
+    def test_weak_values(self):
+        for name, duplicate in [
+            ("pickle", lambda obj: pickle.loads(pickle.dumps(obj))),
+            ("deepcopy", deepcopy),
+        ]:
+            with self.subTest(name):
+                qux = Qux(1)
+                document = qux.document
+
+                qux_copy = duplicate(qux)
+                m.reset_mock()
+
+                document_copy = qux_copy.document
+
+                self.assertEqual(1, document_copy.x)
+                self.assertIsNot(document, document_copy)
+                m.assert_called_once_with("document")
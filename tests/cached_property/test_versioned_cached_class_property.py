@@ -0,0 +1,87 @@
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import VersionedType, versioned_cached_class_property
+
+
+class TestVersionedCachedClassProperty(TestCase):
+    def test_versioned_cached_class_property_basic(self):
+        m = Mock()
+
+        class Foo(metaclass=VersionedType):
+            name = "Foo"
+
+            @versioned_cached_class_property
+            def identifier(cls):
+                m(cls)
+                return cls.name.lower()
+
+        class Bar(Foo):
+            name = "Bar"
+
+        class Baz(Foo):
+            name = "Baz"
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual("foo", Foo.identifier)
+                self.assertEqual("bar", Bar.identifier)
+                self.assertEqual("baz", Baz().identifier)
+
+            self.assertEqual(3, m.call_count)
+
+        with self.subTest("Invalidated by changes to the class"):
+            m.reset_mock()
+            Bar.name = "Qux"
+
+            self.assertEqual("qux", Bar.identifier)
+            self.assertEqual("foo", Foo.identifier)
+            self.assertEqual("baz", Baz.identifier)
+            m.assert_called_once_with(Bar)
+
+        with self.subTest("Invalidated by changes to base classes"):
+            m.reset_mock()
+            Foo.other = "Other"
+
+            for cls in [Foo, Bar, Baz]:
+                cls.identifier
+
+            self.assertEqual(3, m.call_count)
+
+        with self.subTest("Invalidated by deletion"):
+            m.reset_mock()
+            del Baz.name
+
+            self.assertEqual("foo", Baz.identifier)
+            m.assert_called_once_with(Baz)
+
+        with self.subTest("Cache cleared explicitly"):
+            Foo.identifier
+            m.reset_mock()
+
+            Foo.__dict__["identifier"].clear_cache.__get__(Foo, Foo)()
+            Foo.identifier
+
+            m.assert_called_once_with(Foo)
+
+    def test_versioned_cached_class_property_eager(self):
+        m = Mock(return_value="Value")
+
+        class Foo(metaclass=VersionedType):
+            @partial(versioned_cached_class_property, eager=True)
+            def var(cls):
+                return m()
+
+        with self.subTest("Eager value used"):
+            self.assertEqual("Value", Foo.var)
+            m.assert_called_once_with()
+
+    def test_versioned_cached_class_property_metaclass(self):
+        class Foo:
+            pass
+
+        prop = versioned_cached_class_property(lambda cls: "Value")
+
+        with self.assertRaisesRegex(TypeError, "must have metaclass VersionedType"):
+            prop.__set_name__(Foo, "var")
@@ -0,0 +1,178 @@
+import asyncio
+import gc
+import sys
+from contextvars import Context, copy_context
+from functools import partial
+from unittest import skipIf
+from unittest.mock import Mock
+
+from more_properties import (
+    context_cached_class_property,
+    context_cached_property,
+    context_cached_static_property,
+)
+from tests.class_property.test_class_property import TestClassProperty
+from tests.class_property.test_static_property import TestStaticProperty
+from tests.test_property import TestProperty
+
+
+class Resource:
+    pass
+
+
+class TestContextCachedProperty(TestProperty):
+    property = context_cached_property
+
+    def test_context_cached_property_basic(self):
+        m = Mock(side_effect=Resource)
+
+        class Foo:
+            @self.property
+            def session(self):
+                return m()
+
+        foo = Foo()
+
+        with self.subTest("Value cached per context"):
+            context = Context()
+            session = context.run(lambda: foo.session)
+
+            self.assertIs(session, context.run(lambda: foo.session))
+            self.assertIsNot(session, Context().run(lambda: foo.session))
+
+        with self.subTest("Value cached per object"):
+            self.assertIsNot(session, context.run(lambda: Foo().session))
+
+        with self.subTest("Value inherited by copied contexts"):
+            self.assertIs(session, context.run(copy_context).run(lambda: foo.session))
+
+    def test_context_cached_property_many(self):
+        class Foo:
+            @self.property
+            def session(self):
+                return Resource()
+
+            session_clear_cache = session.clear_cache
+
+        foos = [Foo() for _ in range(4000)]
+
+        def get_sessions():
+            foos[0].session
+            var = Foo.__dict__["session"].scope_state
+            holders = var.get().holders
+
+            sessions = [foo.session for foo in foos]
+
+            # Written in place, rather than copied per receiver
+            self.assertIs(holders, var.get().holders)
+
+            return sessions
+
+        context = Context()
+        sessions = context.run(get_sessions)
+
+        with self.subTest("Values cached"):
+            cached = context.run(lambda: [foo.session for foo in foos])
+
+            self.assertEqual(sessions, cached)
+
+        with self.subTest("Copied contexts written separately"):
+            copied = context.run(copy_context)
+            copied.run(lambda: Foo().session)
+            copied.run(foos[0].session_clear_cache)
+
+            self.assertIs(sessions[0], context.run(lambda: foos[0].session))
+            self.assertIsNot(sessions[0], copied.run(lambda: foos[0].session))
+
+    # The contextvars backport doesn't give asyncio tasks their own contexts
+    @skipIf(sys.version_info < (3, 7), "Tasks have contexts since Python 3.7")
+    def test_context_cached_property_tasks(self):
+        class Foo:
+            @self.property
+            def session(self):
+                return Resource()
+
+        foo = Foo()
+
+        async def get_sessions():
+            return foo.session, foo.session
+
+        async def main():
+            return await asyncio.gather(get_sessions(), get_sessions())
+
+        (first, first_again), (second, _) = Context().run(asyncio.run, main())
+
+        self.assertIs(first, first_again)
+        self.assertIsNot(first, second)
+
+    def test_context_cached_property_release(self):
+        release = Mock()
+
+        class Foo:
+            @partial(self.property, release=release)
+            def session(self):
+                return Resource()
+
+        with self.subTest("Released with context"):
+            foo = Foo()
+
+            session = Context().run(lambda: foo.session)
+            gc.collect()
+
+            release.assert_called_once_with(session)
+
+        with self.subTest("Released with object"):
+            release.reset_mock()
+
+            context = Context()
+            foos = [Foo() for _ in range(1000)]
+
+            for foo in foos:
+                context.run(lambda: foo.session)
+
+            del foo, foos
+            gc.collect()
+
+            self.assertEqual(1000, release.call_count)
+
+
+class TestContextCachedClassProperty(TestClassProperty):
+    class_property = context_cached_class_property
+
+    def test_context_cached_class_property_basic(self):
+        class Foo:
+            @self.class_property
+            def session(cls):
+                return Resource()
+
+        class Bar(Foo):
+            pass
+
+        context = Context()
+        session = context.run(lambda: Foo.session)
+
+        self.assertIs(session, context.run(lambda: Foo().session))
+        self.assertIsNot(session, context.run(lambda: Bar.session))
+        self.assertIsNot(session, Context().run(lambda: Foo.session))
+
+
+class TestContextCachedStaticProperty(TestStaticProperty):
+    static_property = context_cached_static_property
+
+    def test_context_cached_static_property_basic(self):
+        class Foo:
+            @self.static_property
+            def session():
+                return Resource()
+
+        class Bar(Foo):
+            pass
+
+        context = Context()
+        session = context.run(lambda: Foo.session)
+
+        self.assertIs(session, context.run(lambda: Bar().session))
+        self.assertIsNot(session, Context().run(lambda: Foo.session))
+
+
+del TestProperty, TestClassProperty, TestStaticProperty
@@ -0,0 +1,132 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Thread
+from unittest.mock import Mock
+
+from more_properties import (
+    thread_local_cached_class_property,
+    thread_local_cached_property,
+    thread_local_cached_static_property,
+)
+from tests.class_property.test_class_property import TestClassProperty
+from tests.class_property.test_static_property import TestStaticProperty
+from tests.test_property import TestProperty
+
+
+def in_thread(func):
+    result = []
+
+    thread = Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+
+    return result[0]
+
+
+class Resource:
+    pass
+
+
+class TestThreadLocalCachedProperty(TestProperty):
+    property = thread_local_cached_property
+
+    def test_thread_local_cached_property_basic(self):
+        m = Mock(side_effect=Resource)
+
+        class Foo:
+            @self.property
+            def session(self):
+                return m()
+
+        foo = Foo()
+
+        with self.subTest("Value cached per thread"):
+            session = foo.session
+
+            self.assertIs(session, foo.session)
+            self.assertIsNot(session, in_thread(lambda: foo.session))
+            self.assertEqual(2, m.call_count)
+
+        with self.subTest("Value cached per object"):
+            self.assertIsNot(session, Foo().session)
+
+        with self.subTest("Value shared by pooled threads"):
+            m.reset_mock()
+
+            with ThreadPoolExecutor(1) as executor:
+                sessions = {
+                    executor.submit(lambda: foo.session).result() for _ in range(3)
+                }
+
+            self.assertEqual(1, len(sessions))
+            m.assert_called_once_with()
+
+    def test_thread_local_cached_property_release(self):
+        release = Mock()
+
+        class Foo:
+            @partial(self.property, release=release)
+            def session(self):
+                return Resource()
+
+            session_clear_cache = session.clear_cache
+
+        foo = Foo()
+
+        with self.subTest("Released when thread ends"):
+            session = in_thread(lambda: foo.session)
+            gc.collect()
+
+            release.assert_called_once_with(session)
+
+        with self.subTest("Released when cache cleared"):
+            release.reset_mock()
+
+            session = foo.session
+            release.assert_not_called()
+
+            foo.session_clear_cache()
+
+            release.assert_called_once_with(session)
+            self.assertIsNot(session, foo.session)
+
+
+class TestThreadLocalCachedClassProperty(TestClassProperty):
+    class_property = thread_local_cached_class_property
+
+    def test_thread_local_cached_class_property_basic(self):
+        class Foo:
+            @self.class_property
+            def session(cls):
+                return Resource()
+
+        class Bar(Foo):
+            pass
+
+        session = Foo.session
+
+        self.assertIs(session, Foo().session)
+        self.assertIsNot(session, Bar.session)
+        self.assertIsNot(session, in_thread(lambda: Foo.session))
+
+
+class TestThreadLocalCachedStaticProperty(TestStaticProperty):
+    static_property = thread_local_cached_static_property
+
+    def test_thread_local_cached_static_property_basic(self):
+        class Foo:
+            @self.static_property
+            def session():
+                return Resource()
+
+        class Bar(Foo):
+            pass
+
+        session = Foo.session
+
+        self.assertIs(session, Bar().session)
+        self.assertIsNot(session, in_thread(lambda: Foo.session))
+
+
+del TestProperty, TestClassProperty, TestStaticProperty
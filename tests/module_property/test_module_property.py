@@ -0,0 +1,104 @@
+import sys
+from textwrap import dedent
+from types import ModuleType
+from unittest import TestCase
+from unittest.mock import Mock
+
+
+def make_module(name, source, **namespace):
+    module = ModuleType(name)
+    module.__dict__.update(namespace)
+
+    sys.modules[name] = module
+
+    try:
+        exec(dedent(source), module.__dict__)
+    finally:
+        del sys.modules[name]
+
+    return module
+
+
+class TestModuleProperty(TestCase):
+    def test_module_property_basic(self):
+        m = Mock(return_value="Value")
+
+        module = make_module(
+            "lazy_module",
+            """
+            from more_properties import module_property
+
+            @module_property
+            def var():
+                \"\"\"Lazy variable\"\"\"
+                return m()
+            """,
+            m=m,
+        )
+
+        with self.subTest("Not computed on import"):
+            m.assert_not_called()
+
+        with self.subTest("Computed on access"):
+            for _ in range(3):
+                self.assertEqual("Value", module.var)
+
+            self.assertEqual(3, m.call_count)
+
+        with self.subTest("Listed"):
+            self.assertIn("var", dir(module))
+
+        with self.subTest("Docstring"):
+            self.assertEqual("Lazy variable", type(module).__dict__["var"].__doc__)
+
+        with self.subTest("Not shared with other modules"):
+            self.assertFalse(hasattr(ModuleType("another_module"), "var"))
+
+    def test_cached_module_property_basic(self):
+        m = Mock(return_value="Value")
+
+        module = make_module(
+            "lazy_module",
+            """
+            from more_properties import cached_module_property
+
+            @cached_module_property
+            def var():
+                return m()
+
+            # Outside a class body, the staticmethod isn't unwrapped
+            var_clear_cache = var.clear_cache.__func__
+            """,
+            m=m,
+        )
+
+        with self.subTest("Not computed on import"):
+            m.assert_not_called()
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual("Value", module.var)
+
+            m.assert_called_once_with()
+
+        with self.subTest("Cache cleared explicitly"):
+            m.reset_mock()
+
+            module.var_clear_cache()
+
+            for _ in range(3):
+                self.assertEqual("Value", module.var)
+
+            m.assert_called_once_with()
+
+        with self.subTest("Imported"):
+            m.reset_mock()
+            sys.modules["lazy_module"] = module
+
+            try:
+                from lazy_module import var
+            finally:
+                del sys.modules["lazy_module"]
+
+            self.assertEqual("Value", var)
+            m.assert_not_called()
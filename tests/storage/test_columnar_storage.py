@@ -0,0 +1,205 @@
+import gc
+from copy import copy
+from dataclasses import dataclass
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import ColumnarStorage, cached_property
+
+
+class TestColumnarStorage(TestCase):
+    def test_columnar_storage_basic(self):
+        m = Mock()
+
+        @dataclass
+        class Point:
+            x: float
+            y: float
+
+            @partial(cached_property, storage=ColumnarStorage("d"))
+            def norm(self):
+                m(self)
+                return (self.x ** 2 + self.y ** 2) ** 0.5
+
+            @partial(cached_property, storage=ColumnarStorage("q"))
+            def manhattan(self):
+                return int(abs(self.x) + abs(self.y))
+
+            norm_clear_cache = norm.clear_cache
+
+        points = [Point(3 * i, 4 * i) for i in range(20)]
+        rows = Point.__dict__["norm"].storage.rows
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                for i, point in enumerate(points):
+                    self.assertEqual(5 * i, point.norm)
+
+            self.assertEqual(20, m.call_count)
+
+        with self.subTest("Value not stored on instance"):
+            self.assertEqual({"x": 0, "y": 0}, points[0].__dict__)
+
+        with self.subTest("Row shared between properties"):
+            self.assertEqual(7, points[1].manhattan)
+            self.assertEqual(1, rows.row(points[1]))
+
+        with self.subTest("Cache cleared explicitly"):
+            m.reset_mock()
+
+            points[1].norm_clear_cache()
+
+            self.assertEqual(5, points[1].norm)
+            m.assert_called_once_with(points[1])
+
+        with self.subTest("Copies don't share rows"):
+            m.reset_mock()
+
+            point_copy = copy(points[2])
+
+            self.assertEqual(10, point_copy.norm)
+            m.assert_called_once_with(point_copy)
+            self.assertEqual(20, rows.row(point_copy))
+
+    def test_columnar_storage_column(self):
+        storage = ColumnarStorage("d")
+
+        @dataclass
+        class Point:
+            x: float
+
+            @partial(cached_property, storage=storage)
+            def double(self):
+                return self.x * 2
+
+        points = [Point(i) for i in range(10)]
+
+        for point in points[::2]:
+            point.double
+
+        with self.subTest("Values"):
+            values = storage.values()
+
+            # Rows are only assigned to instances with cached values
+            self.assertEqual([0, 4, 8, 12, 16], values.tolist()[:5])
+            values.release()
+
+        with self.subTest("Validity"):
+            self.assertEqual(0b00011111, storage.validity()[0])
+
+        with self.subTest("Rows reused once collected"):
+            del points[0]
+            gc.collect()
+
+            # Freed the next time a value is cached
+            point = Point(100)
+            point.double
+
+            self.assertEqual(0, storage.rows.row(point))
+            self.assertEqual(200, storage.values()[0])
+
+    def test_columnar_storage_growth(self):
+        storage = ColumnarStorage("q")
+
+        class Foo:
+            __slots__ = ("x", "__weakref__")
+
+            def __init__(self, x):
+                self.x = x
+
+            @partial(cached_property, storage=storage)
+            def double(self):
+                return self.x * 2
+
+        foos = [Foo(i) for i in range(4)]
+
+        for foo in foos:
+            foo.double
+
+        values = storage.values()
+
+        with self.subTest("Grows while viewed"):
+            foos.extend(Foo(i) for i in range(4, 100))
+
+            for foo in foos:
+                self.assertEqual(foo.x * 2, foo.double)
+
+        with self.subTest("View unchanged"):
+            self.assertEqual([0, 2, 4, 6], values.tolist()[:4])
+
+    def test_columnar_storage_collected(self):
+        released = Mock()
+
+        class Foo:
+            def __init__(self, x):
+                self.x = x
+
+            def __del__(self):
+                released(self.x)
+
+            @partial(cached_property, storage=ColumnarStorage("q"))
+            def double(self):
+                return self.x * 2
+
+        class Bar(Foo):
+            # Doesn't call the original
+            def __del__(self):
+                pass
+
+        rows = Foo.__dict__["double"].storage.rows
+
+        for cls in [Foo, Bar]:
+            with self.subTest("Rows freed", cls=cls):
+                instances = [cls(i) for i in range(3000)]
+
+                for instance in instances:
+                    instance.double
+
+                del instance, instances
+                gc.collect()
+
+                cls(0).double
+
+                self.assertEqual(3000, rows.size)
+                self.assertEqual(1, rows.live)
+
+        with self.subTest("Original called"):
+            self.assertEqual(3000 + 1, released.call_count)
+
+        with self.subTest("Identities reused"):
+            for i in range(1000):
+                self.assertEqual(i * 2, Foo(i).double)
+
+    def test_columnar_storage_coerced(self):
+        storage = ColumnarStorage("d")
+
+        class Foo:
+            def __init__(self, x):
+                self.x = x
+
+            @partial(cached_property, storage=storage)
+            def y(self):
+                return self.x
+
+        with self.subTest("Same type on miss and hit"):
+            foo = Foo(1)
+
+            self.assertIs(float, type(foo.y))
+            self.assertIs(float, type(foo.y))
+
+        with self.subTest("Rejected before assigning a row"):
+            with self.assertRaisesRegex(TypeError, "type code 'd' can't hold 'a'"):
+                Foo("a").y
+
+            self.assertEqual(1, storage.rows.size)
+
+    def test_columnar_storage_reused(self):
+        storage = ColumnarStorage("d")
+        b = cached_property(lambda self: 2, storage=storage)
+
+        class Foo:
+            a = cached_property(lambda self: 1, storage=storage)
+
+        with self.assertRaisesRegex(ValueError, "already used by .*Foo.a"):
+            b.__set_name__(Foo, "b")
@@ -0,0 +1,140 @@
+import gc
+from functools import partial
+from typing import NamedTuple
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import ExternalStorage, cached_property
+
+
+class TestExternalStorage(TestCase):
+    def test_external_storage_named_tuple(self):
+        m = Mock()
+        storage = ExternalStorage()
+
+        class Point(NamedTuple):
+            x: float
+            y: float
+
+            @partial(cached_property, storage=storage)
+            def norm(self):
+                m(self)
+                return (self.x ** 2 + self.y ** 2) ** 0.5
+
+        point = Point(3, 4)
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual(5, point.norm)
+
+            m.assert_called_once_with(point)
+
+        with self.subTest("Identity keyed"):
+            self.assertEqual(5, Point(3, 4).norm)
+            self.assertEqual(2, m.call_count)
+
+        with self.subTest("Not weakly referenceable, so held strongly"):
+            self.assertIn(point, [entry[0] for entry in storage.fallback.data.values()])
+
+        with self.subTest("Cache cleared explicitly"):
+            m.reset_mock()
+            Point.__dict__["norm"].clear_cache(point)
+
+            self.assertEqual(5, point.norm)
+            m.assert_called_once_with(point)
+
+    def test_external_storage_slots(self):
+        m = Mock()
+
+        class Point:
+            __slots__ = ("x", "y", "__weakref__")
+
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+            @partial(cached_property, storage=ExternalStorage())
+            def norm(self):
+                m(self)
+                return (self.x ** 2 + self.y ** 2) ** 0.5
+
+            norm_clear_cache = norm.clear_cache
+
+        point = Point(3, 4)
+        storage = Point.__dict__["norm"].storage
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual(5, point.norm)
+
+            m.assert_called_once_with(point)
+            self.assertEqual(1, len(storage))
+
+        with self.subTest("Cache cleared explicitly"):
+            m.reset_mock()
+            point.norm_clear_cache()
+
+            self.assertEqual(0, len(storage))
+            self.assertEqual(5, point.norm)
+            m.assert_called_once_with(point)
+
+        with self.subTest("Entry dropped when collected"):
+            m.reset_mock()
+            del point
+            gc.collect()
+
+            self.assertEqual(0, len(storage))
+
+        with self.subTest("Reused identities not confused"):
+            m.reset_mock()
+
+            for x in range(10):
+                self.assertEqual(x, Point(x, 0).norm)
+
+            self.assertEqual(10, m.call_count)
+
+    def test_external_storage_fallback_size(self):
+        class Point(NamedTuple):
+            x: float
+
+            @partial(cached_property, storage=ExternalStorage(fallback_size=2))
+            def double(self):
+                return 2 * self.x
+
+        points = [Point(x) for x in range(5)]
+
+        for point in points:
+            point.double
+
+        self.assertEqual(2, len(Point.__dict__["double"].storage))
+
+    def test_external_storage_write_through(self):
+        class Point(NamedTuple):
+            x: float
+
+            @partial(cached_property, storage=ExternalStorage(), write_through=True)
+            def label(self):
+                return str(self.x)
+
+            @label.setter
+            def label(self, value):
+                pass
+
+        point = Point(1)
+        Point.__dict__["label"].__set__(point, "One")
+
+        self.assertEqual("One", point.label)
+
+    def test_external_storage_eager(self):
+        with self.assertRaisesRegex(ValueError, "can't be eager"):
+            cached_property(lambda self: 1, eager=True, storage=ExternalStorage())
+
+    def test_external_storage_reused(self):
+        storage = ExternalStorage()
+        b = cached_property(lambda self: 2, storage=storage)
+
+        class Foo:
+            a = cached_property(lambda self: 1, storage=storage)
+
+        with self.assertRaisesRegex(ValueError, "already used by .*Foo.a"):
+            b.__set_name__(Foo, "b")
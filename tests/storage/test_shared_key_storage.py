@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import SharedKeyStorage, cached_property
+
+
+class TestSharedKeyStorage(TestCase):
+    def test_shared_key_storage_basic(self):
+        m = Mock()
+
+        @dataclass
+        class Point:
+            x: float
+            y: float
+
+            @partial(cached_property, storage=SharedKeyStorage())
+            def norm(self):
+                m("norm")
+                return (self.x ** 2 + self.y ** 2) ** 0.5
+
+            @partial(cached_property, storage=SharedKeyStorage())
+            def manhattan(self):
+                m("manhattan")
+                return abs(self.x) + abs(self.y)
+
+            norm_clear_cache = norm.clear_cache
+
+        @dataclass
+        class Point3D(Point):
+            z: float = 0
+
+            @partial(cached_property, storage=SharedKeyStorage())
+            def volume(self):
+                return self.x * self.y * self.z
+
+        point = Point(3, 4)
+
+        with self.subTest("Value cached"):
+            for _ in range(3):
+                self.assertEqual(7, point.manhattan)
+
+            m.assert_called_once_with("manhattan")
+
+        with self.subTest("Keys reserved in order of definition"):
+            self.assertEqual(
+                ["x", "y", "__norm_cache", "__manhattan_cache"], list(point.__dict__)
+            )
+
+        with self.subTest("Reserved keys not values"):
+            m.reset_mock()
+
+            self.assertEqual(5, point.norm)
+            m.assert_called_once_with("norm")
+
+        with self.subTest("Keys kept when cache cleared"):
+            m.reset_mock()
+
+            point.norm_clear_cache()
+
+            self.assertEqual(
+                ["x", "y", "__norm_cache", "__manhattan_cache"], list(point.__dict__)
+            )
+            self.assertEqual(5, point.norm)
+            m.assert_called_once_with("norm")
+
+        with self.subTest("Subclass keys follow base class keys"):
+            point = Point3D(1, 2, 3)
+
+            self.assertEqual(6, point.volume)
+            self.assertEqual(
+                ["x", "y", "z", "__norm_cache", "__manhattan_cache", "__volume_cache"],
+                list(point.__dict__),
+            )
+
+    def test_shared_key_storage_reused(self):
+        storage = SharedKeyStorage()
+        b = cached_property(lambda self: 2, storage=storage)
+
+        class Foo:
+            a = cached_property(lambda self: 1, storage=storage)
+
+        with self.assertRaisesRegex(ValueError, "already used by .*Foo.a"):
+            b.__set_name__(Foo, "b")
@@ -0,0 +1,131 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from more_properties import (
+    CachingAdvisor,
+    cached_property,
+    class_property,
+    property,
+    static_property,
+)
+
+
+class TestCachingAdvisor(TestCase):
+    def test_caching_advisor_basic(self):
+        m = Mock()
+
+        class Foo:
+            def __init__(self, x):
+                self.x = x
+
+            @property
+            def pure(self):
+                return self.x + 1
+
+            @property
+            def impure(self):
+                m()
+                return m.call_count
+
+            @class_property
+            def name(cls):
+                return cls.__name__
+
+            @static_property
+            def constant():
+                return 42
+
+            @cached_property
+            def cached(self):
+                return self.x
+
+        foos = [Foo(1), Foo(2)]
+
+        with CachingAdvisor() as advisor:
+            for _ in range(3):
+                for foo in foos:
+                    foo.pure
+                    foo.impure
+                    foo.cached
+                    Foo.name
+                    Foo.constant
+
+        candidates = {candidate.name: candidate for candidate in advisor.report()}
+
+        with self.subTest("Pure properties recommended"):
+            self.assertEqual({"pure", "name", "constant"}, set(candidates))
+
+        with self.subTest("Calls counted"):
+            self.assertEqual(6, candidates["pure"].calls)
+            self.assertEqual(2, candidates["pure"].receivers)
+            self.assertEqual(1, candidates["name"].receivers)
+
+        with self.subTest("Suggestions"):
+            self.assertEqual("cached_property", candidates["pure"].suggestion)
+            self.assertFalse(candidates["pure"].freezable)
+            self.assertEqual("cached_class_property", candidates["name"].suggestion)
+            self.assertTrue(candidates["name"].freezable)
+            self.assertEqual(
+                "cached_static_property", candidates["constant"].suggestion
+            )
+
+        with self.subTest("Cached properties not profiled"):
+            self.assertNotIn("cached", [name for _, name in advisor.stats])
+
+        with self.subTest("Ranked by estimated savings"):
+            savings = [candidate.estimated_savings for candidate in advisor.report()]
+            self.assertEqual(sorted(savings, reverse=True), savings)
+
+        with self.subTest("Stopped on exit"):
+            foos[0].pure
+            self.assertEqual(6, candidates["pure"].calls)
+            self.assertEqual(6, advisor.stats[Foo, "pure"].calls)
+
+    def test_caching_advisor_attribute_names(self):
+        def get_x(self):
+            return 1
+
+        def get_identifier(cls):
+            return cls.__name__.lower()
+
+        class Foo:
+            x = property(get_x)
+            y = property(get_x)
+            identifier = class_property(get_identifier)
+
+        foo = Foo()
+
+        with CachingAdvisor() as advisor:
+            for _ in range(3):
+                foo.x
+                foo.y
+                Foo.identifier
+
+        candidates = {candidate.name: candidate for candidate in advisor.report()}
+
+        self.assertEqual({"x", "y", "identifier"}, set(candidates))
+        self.assertEqual(3, candidates["x"].calls)
+        self.assertEqual(3, candidates["y"].calls)
+
+    def test_caching_advisor_sampling(self):
+        class Foo:
+            @property
+            def bar(self):
+                return 1
+
+        foo = Foo()
+
+        with CachingAdvisor(sample_every=3) as advisor:
+            for _ in range(9):
+                foo.bar
+
+        stats = advisor.stats[Foo, "bar"]
+
+        self.assertEqual(9, stats.calls)
+        self.assertEqual(3, stats.sampled)
+        self.assertEqual(2, stats.repeats)
+
+    def test_caching_advisor_single(self):
+        with CachingAdvisor():
+            with self.assertRaisesRegex(RuntimeError, "already active"):
+                CachingAdvisor().start()
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from more_properties import InternTable
+
+
+class Document:
+    def __init__(self, source):
+        self.source = source
+
+    def __eq__(self, other):
+        return isinstance(other, Document) and self.source == other.source
+
+    def __hash__(self):
+        return hash(self.source)
+
+
+class TestInternTable(TestCase):
+    def test_intern_table_basic(self):
+        table = InternTable()
+
+        for make_value in [
+            lambda: tuple([1, 2]),
+            lambda: "".join(["fo", "o"]),
+            lambda: Document("foo"),
+        ]:
+            with self.subTest(value=make_value()):
+                value = make_value()
+                another_value = make_value()
+
+                self.assertIsNot(value, another_value)
+                self.assertIs(value, table.intern(value))
+                self.assertIs(value, table.intern(another_value))
+
+        self.assertEqual(3, table.hits)
+        self.assertEqual(6, table.lookups)
+        self.assertEqual(0.5, table.dedup_ratio)
+
+    def test_intern_table_unhashable(self):
+        table = InternTable()
+
+        value = [1, 2]
+
+        self.assertIs(value, table.intern(value))
+        self.assertIsNot(value, table.intern([1, 2]))
+
+    def test_intern_table_distinguishes_types(self):
+        table = InternTable()
+
+        self.assertIs(int, type(table.intern(1)))
+        self.assertIs(float, type(table.intern(1.0)))
+        self.assertIs(bool, type(table.intern(True)))
+
+        for value, equal_value in [
+            ((1, 2), (1.0, 2.0)),
+            ((1, 2), (True, 2)),
+            (((1,), 2), ((1.0,), 2)),
+            (frozenset({1}), frozenset({1.0})),
+            (0.0, -0.0),
+        ]:
+            with self.subTest(value=value, equal_value=equal_value):
+                table.intern(value)
+
+                self.assertEqual(repr(equal_value), repr(table.intern(equal_value)))
+
+    def test_intern_table_bounded(self):
+        table = InternTable(size=2)
+
+        for i in range(10):
+            table.intern(tuple([i]))
+
+        self.assertEqual(2, len(table.strong_values))
+
+    def test_intern_table_weak(self):
+        table = InternTable()
+
+        table.intern(Document("foo"))
+
+        value = Document("foo")
+
+        self.assertIs(value, table.intern(value))
+        self.assertEqual(0, table.hits)